@@ -9,14 +9,17 @@ Space Complexity: O(n) - for storing activities
 """
 import time
 
+from .trace import SELECT, REJECT
 
-def activity_selection(start_times, finish_times):
+
+def activity_selection(start_times, finish_times, trace=None):
     """
     Solve the Activity Selection problem using a greedy approach.
     
     Args:
         start_times: List of activity start times
         finish_times: List of activity finish times
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
     
     Returns:
         Dictionary containing:
@@ -63,6 +66,10 @@ def activity_selection(start_times, finish_times):
                 'width_percent': round(max(width_pct, 5), 2)  # Min 5% for visibility
             })
             last_finish_time = activity['finish']
+            if trace is not None:
+                trace.record(SELECT, activity['index'], activity['finish'])
+        elif trace is not None:
+            trace.record(REJECT, activity['index'], last_finish_time)
     
     # Create all activities data for visualization (both selected and not selected)
     all_activities = []
@@ -9,8 +9,10 @@ Space Complexity: O(max_deadline) for the time slots
 """
 import time
 
+from .trace import CONSIDER, SLOT_CLAIM, REJECT
 
-def job_scheduling(job_ids, deadlines, profits):
+
+def job_scheduling(job_ids, deadlines, profits, trace=None):
     """
     Solve the Job Scheduling problem to maximize profit.
     
@@ -18,6 +20,7 @@ def job_scheduling(job_ids, deadlines, profits):
         job_ids: List of job identifiers
         deadlines: List of job deadlines
         profits: List of job profits
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
     
     Returns:
         Dictionary containing:
@@ -35,6 +38,7 @@ def job_scheduling(job_ids, deadlines, profits):
     jobs = []
     for i in range(n):
         jobs.append({
+            'index': i,
             'id': job_ids[i],
             'deadline': deadlines[i],
             'profit': profits[i]
@@ -55,6 +59,8 @@ def job_scheduling(job_ids, deadlines, profits):
     schedule = {}
     
     for job in jobs:
+        if trace is not None:
+            trace.record(CONSIDER, job['index'], job['deadline'])
         # Find a free slot for this job (latest possible before deadline)
         for slot in range(min(max_deadline, job['deadline']), 0, -1):
             if time_slots[slot] == -1:
@@ -68,7 +74,12 @@ def job_scheduling(job_ids, deadlines, profits):
                 })
                 schedule[slot] = job['id']
                 total_profit += job['profit']
+                if trace is not None:
+                    trace.record(SLOT_CLAIM, slot, job['index'])
                 break
+        else:
+            if trace is not None:
+                trace.record(REJECT, job['index'], job['deadline'])
     
     # Sort selected jobs by scheduled time for display
     selected_jobs.sort(key=lambda x: x['scheduled_at'])
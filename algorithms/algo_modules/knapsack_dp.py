@@ -6,11 +6,27 @@ Items cannot be divided - either take the whole item or leave it.
 
 Time Complexity: O(n * W) where W is capacity
 Space Complexity: O(n * W) for the DP table
+
+When item values are small integers but weights and capacity are large, the
+dual table indexed by total value is used instead (see min_weight_knapsack):
+
+Time Complexity: O(n * V) where V is the sum of item values
+Space Complexity: O(n * V) for the per-item choice flags
 """
+import math
 import time
 
+from .trace import DP_CELL, BACKTRACK
+
+
+# Use the value-indexed table when it is at least this many times smaller
+VALUE_INDEXED_SPEEDUP = 4
 
-def zero_one_knapsack(weights, values, capacity):
+# Decimal places a fractional weight may have for the capacity-indexed DP
+WEIGHT_DECIMALS = 6
+
+
+def zero_one_knapsack(weights, values, capacity, trace=None):
     """
     Solve the 0/1 Knapsack problem using dynamic programming.
     
@@ -18,6 +34,7 @@ def zero_one_knapsack(weights, values, capacity):
         weights: List of item weights (must be integers)
         values: List of item values
         capacity: Maximum capacity of the knapsack (must be integer)
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
     
     Returns:
         Dictionary containing:
@@ -45,7 +62,10 @@ def zero_one_knapsack(weights, values, capacity):
             # Take item i if possible
             if weights[i-1] <= w:
                 value_with_item = dp[i-1][w - weights[i-1]] + values[i-1]
-                dp[i][w] = max(dp[i][w], value_with_item)
+                if value_with_item > dp[i][w]:
+                    dp[i][w] = value_with_item
+                    if trace is not None:
+                        trace.record(DP_CELL, i - 1, w)
     
     max_value = dp[n][capacity]
     
@@ -61,6 +81,8 @@ def zero_one_knapsack(weights, values, capacity):
                 'fraction': 1.0,
                 'value_contributed': values[i-1]
             })
+            if trace is not None:
+                trace.record(BACKTRACK, i - 1, w)
             w -= weights[i-1]
     
     selected_items.reverse()  # Show in original order
@@ -77,3 +99,169 @@ def zero_one_knapsack(weights, values, capacity):
         'algorithm_type': 'Dynamic Programming',
         'allows_fraction': False
     }
+
+
+def min_weight_knapsack(weights, values, capacity, trace=None):
+    """
+    Solve the 0/1 Knapsack problem with a DP indexed by total value.
+    
+    Args:
+        weights: List of item weights (any real numbers)
+        values: List of item values (must be integers)
+        capacity: Maximum capacity of the knapsack
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
+    
+    Returns:
+        Dictionary in the same format as zero_one_knapsack
+    """
+    start_time = time.perf_counter()
+    
+    n = len(weights)
+    int_values = [int(v) for v in values]
+    
+    picked, value_limit = _min_weight_selection(weights, int_values, capacity, trace)
+    
+    selected_items = []
+    for i in picked:
+        selected_items.append({
+            'item_index': i + 1,  # 1-indexed for display
+            'weight': weights[i],
+            'value': values[i],
+            'fraction': 1.0,
+            'value_contributed': values[i]
+        })
+    max_value = sum(item['value'] for item in selected_items)
+    
+    end_time = time.perf_counter()
+    execution_time = (end_time - start_time) * 1000
+    
+    return {
+        'max_value': max_value,
+        'selected_items': selected_items,
+        'execution_time': round(execution_time, 4),
+        'time_complexity': f'O(n × V) = O({n} × {value_limit})',
+        'space_complexity': f'O(n × V) = O({n} × {value_limit})',
+        'algorithm_type': 'Dynamic Programming (value-indexed)',
+        'allows_fraction': False
+    }
+
+
+def exact_knapsack(weights, values, capacity, trace=None):
+    """
+    Solve the 0/1 Knapsack problem with whichever exact DP has the smaller table.
+    
+    The value-indexed table is chosen when every value is an integer and the
+    sum of values is much smaller than the capacity. Fractional weights are
+    scaled to integers by a power of ten before the capacity-indexed DP runs.
+    """
+    if exact_engine(weights, values, capacity) == 'min_weight_knapsack':
+        return min_weight_knapsack(weights, values, capacity, trace)
+    
+    scale = weight_scale(weights)
+    if scale is None:
+        raise ValueError(f"Weights need more than {WEIGHT_DECIMALS} decimal places for an exact DP")
+    if scale == 1:
+        return zero_one_knapsack(weights, values, capacity, trace)
+    
+    scaled_weights = [round(w * scale) for w in weights]
+    result = zero_one_knapsack(scaled_weights, values, _scaled_capacity(capacity, scale), trace)
+    result['selected_items'] = [dict(item, weight=weights[item['item_index'] - 1])
+                                for item in result['selected_items']]
+    return result
+
+
+def exact_engine(weights, values, capacity):
+    """Name of the exact DP that exact_knapsack runs for this instance."""
+    value_cells = value_indexed_cells(weights, values, capacity)
+    if value_cells != float('inf') and value_cells * VALUE_INDEXED_SPEEDUP <= capacity_indexed_cells(weights, capacity):
+        return 'min_weight_knapsack'
+    return 'zero_one_knapsack'
+
+
+def weight_scale(weights):
+    """
+    Smallest power of ten that turns every weight into an integer, or None
+    when that takes more than WEIGHT_DECIMALS decimal places.
+    """
+    for decimals in range(WEIGHT_DECIMALS + 1):
+        scale = 10 ** decimals
+        if all(abs(w * scale - round(w * scale)) <= 1e-9 * max(1, abs(w * scale)) for w in weights):
+            return scale
+    return None
+
+
+def capacity_indexed_cells(weights, capacity):
+    """
+    Number of cells in the zero_one_knapsack table once weights are scaled
+    to integers, or infinity when they cannot be.
+    """
+    scale = weight_scale(weights)
+    if scale is None:
+        return float('inf')
+    return len(weights) * (_scaled_capacity(capacity, scale) + 1)
+
+
+def _scaled_capacity(capacity, scale):
+    """Capacity in units of 1 / scale, rounded down."""
+    scaled = capacity * scale
+    return math.floor(scaled + 1e-9 * max(1, abs(scaled)))
+
+
+def value_indexed_cells(weights, values, capacity):
+    """
+    Number of cells in the min_weight_knapsack table, or infinity when the
+    values are not all integers.
+    """
+    if not all(float(v).is_integer() for v in values):
+        return float('inf')
+    value_limit = sum(int(v) for w, v in zip(weights, values) if w <= capacity and v > 0)
+    return len(weights) * (value_limit + 1)
+
+
+def _min_weight_selection(weights, values, capacity, trace=None):
+    """
+    Find the most valuable item set by computing, for every reachable total
+    value, the lightest set of items reaching it.
+    
+    Values must be integers. Returns the 0-indexed selected items in original
+    order and the size of the value axis.
+    """
+    # Only items that fit on their own and add value can be part of a solution
+    candidates = [i for i in range(len(weights)) if weights[i] <= capacity and values[i] > 0]
+    value_limit = sum(values[i] for i in candidates)
+    
+    # min_weight[p] = lightest weight reaching value exactly p
+    inf = float('inf')
+    min_weight = [0] + [inf] * value_limit
+    taken = []
+    
+    # Fill the DP row item by item, keeping one choice flag per cell
+    reachable = 0
+    for i in candidates:
+        item_weight = weights[i]
+        item_value = values[i]
+        choice = bytearray(value_limit + 1)
+        reachable += item_value
+        for p in range(reachable, item_value - 1, -1):
+            weight_with_item = min_weight[p - item_value] + item_weight
+            if weight_with_item < min_weight[p]:
+                min_weight[p] = weight_with_item
+                choice[p] = 1
+                if trace is not None:
+                    trace.record(DP_CELL, i, p)
+        taken.append(choice)
+    
+    best_value = max(p for p in range(value_limit + 1) if min_weight[p] <= capacity)
+    
+    # Backtrack to find selected items
+    picked = []
+    p = best_value
+    for k in range(len(candidates) - 1, -1, -1):
+        if taken[k][p]:
+            picked.append(candidates[k])
+            if trace is not None:
+                trace.record(BACKTRACK, candidates[k], p)
+            p -= values[candidates[k]]
+    
+    picked.reverse()  # Original order
+    return picked, value_limit
@@ -0,0 +1,142 @@
+"""
+0/1 Knapsack Approximation - FPTAS (Fully Polynomial-Time Approximation Scheme)
+
+This module implements an approximate 0/1 Knapsack solver whose running time
+does not depend on the capacity. Item values are scaled down by a factor
+K = ε × v_max / n and a DP over the (small) scaled value totals finds the
+lightest item set reaching each value. The chosen set is guaranteed to be
+worth at least (1 − ε) × OPT.
+
+Time Complexity: O(n³ / ε) - n items × at most n² / ε scaled value totals
+Space Complexity: O(n² / ε) for the DP row and the per-item choice flags
+"""
+import math
+import time
+
+from .knapsack_dp import _min_weight_selection
+from .knapsack_greedy import fractional_knapsack
+
+
+DEFAULT_EPSILON = 0.1
+
+# Largest ε tried when fitting the table into a cell budget; beyond it the
+# greedy ½-approximation is both faster and at least as good
+MAX_EPSILON = 0.5
+
+
+def fptas_knapsack(weights, values, capacity, epsilon=DEFAULT_EPSILON, trace=None):
+    """
+    Approximate the 0/1 Knapsack problem within a factor of (1 − ε).
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum capacity of the knapsack
+        epsilon: Allowed relative error, 0 < ε < 1 (smaller is slower)
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
+
+    Returns:
+        Dictionary containing:
+        - max_value: Value of the selected items (≥ (1 − ε) × OPT)
+        - selected_items: List of selected item details
+        - upper_bound: Fractional Knapsack value, an upper bound on OPT
+        - optimality_gap: Distance between max_value and the best known bound
+        - execution_time: Time taken to execute in milliseconds
+        - time_complexity: Theoretical time complexity
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("Epsilon must be between 0 and 1")
+
+    start_time = time.perf_counter()
+
+    n = len(weights)
+
+    scaled_values = _scaled_values(weights, values, capacity, epsilon)
+    picked, value_limit = _min_weight_selection(weights, scaled_values, capacity, trace)
+
+    selected_items = []
+    for i in picked:
+        selected_items.append({
+            'item_index': i + 1,  # 1-indexed for display
+            'weight': weights[i],
+            'value': values[i],
+            'fraction': 1.0,
+            'value_contributed': values[i]
+        })
+    max_value = sum(item['value'] for item in selected_items)
+
+    end_time = time.perf_counter()
+    execution_time = (end_time - start_time) * 1000
+
+    # OPT lies below both the fractional relaxation and max_value / (1 − ε)
+    upper_bound = fractional_knapsack(weights, values, capacity)['max_value']
+    best_bound = min(upper_bound, max_value / (1 - epsilon))
+    optimality_gap = best_bound - max_value
+
+    return {
+        'max_value': max_value,
+        'selected_items': selected_items,
+        'epsilon': epsilon,
+        'guarantee': f'≥ (1 − {epsilon}) × OPT',
+        'guaranteed_ratio': round(1 - epsilon, 4),
+        'upper_bound': upper_bound,
+        'optimality_gap': round(optimality_gap, 2),
+        'optimality_gap_percent': round(optimality_gap / best_bound * 100, 2) if best_bound > 0 else 0.0,
+        'execution_time': round(execution_time, 4),
+        'time_complexity': f'O(n³ / ε) = O({n} × {value_limit})',
+        'space_complexity': f'O(n² / ε) = O({value_limit})',
+        'algorithm_type': 'Dynamic Programming (FPTAS)',
+        'allows_fraction': False,
+        'approximation': 'FPTAS',
+        'is_approximate': True
+    }
+
+
+def fptas_cells(weights, values, capacity, epsilon):
+    """Number of cells in the FPTAS table for this instance and ε, in O(n)."""
+    scaled_values = _scaled_values(weights, values, capacity, epsilon)
+    rows = 0
+    value_limit = 0
+    for w, v in zip(weights, scaled_values):
+        if w <= capacity and v > 0:
+            rows += 1
+            value_limit += v
+    return rows * (value_limit + 1)
+
+
+def fptas_epsilon_for_budget(weights, values, capacity, cell_budget, epsilon=DEFAULT_EPSILON):
+    """
+    Pick the smallest ε, no smaller than the requested one, whose FPTAS table
+    fits within the given cell budget.
+
+    The table size is measured from the actual scaled values rather than the
+    n³ / ε worst case. Candidates above the requested ε are tried in steps of
+    0.01 up to MAX_EPSILON; returns None when none of them fits.
+    """
+    if fptas_cells(weights, values, capacity, epsilon) <= cell_budget:
+        return epsilon
+
+    # The table only shrinks as ε grows, so binary search over hundredths
+    low = math.floor(epsilon * 100) + 1
+    high = round(MAX_EPSILON * 100)
+    if low > high or fptas_cells(weights, values, capacity, high / 100) > cell_budget:
+        return None
+    while low < high:
+        mid = (low + high) // 2
+        if fptas_cells(weights, values, capacity, mid / 100) <= cell_budget:
+            high = mid
+        else:
+            low = mid + 1
+    return low / 100
+
+
+def _scaled_values(weights, values, capacity, epsilon):
+    """Item values divided by K = ε × v_max / n and rounded down."""
+    n = len(weights)
+
+    # Only items that fit on their own and add value can be part of a solution
+    max_item_value = max((v for w, v in zip(weights, values) if w <= capacity and v > 0), default=0)
+
+    # Scale values so the largest total is bounded by n² / ε
+    scale = epsilon * max_item_value / n if max_item_value > 0 else 1
+    return [int(v // scale) for v in values]
@@ -0,0 +1,117 @@
+"""
+0/1 Knapsack Governor - Engine Selection Within a Time Budget
+
+This module picks the 0/1 Knapsack engine for an instance. The instance is
+reduced first, then solved exactly with the smaller of the capacity- and
+value-indexed DP tables. If even that table is over the cell budget (or an
+epsilon is requested) the FPTAS approximation is used instead, with ε raised
+until its table fits the budget too. When no ε up to ½ fits, the greedy
+½-approximation is used instead: it offers the same guarantee in O(n log n),
+so no engine ever builds more than the budget.
+
+Time Complexity: that of the chosen engine, bounded by the cell budget
+Space Complexity: that of the chosen engine
+"""
+from .knapsack_dp import exact_knapsack, exact_engine, capacity_indexed_cells, value_indexed_cells, weight_scale
+from .knapsack_fptas import fptas_knapsack, fptas_cells, fptas_epsilon_for_budget, DEFAULT_EPSILON
+from .knapsack_greedy import greedy_knapsack
+from .knapsack_preprocess import preprocess_knapsack, restore_solution
+from .trace import DP_CELL, BACKTRACK
+
+
+# Largest DP table (in cells) built for one instance
+DEFAULT_CELL_BUDGET = 5_000_000
+
+
+def governed_knapsack(weights, values, capacity, epsilon=None, cell_budget=DEFAULT_CELL_BUDGET, trace=None):
+    """
+    Solve the 0/1 Knapsack problem with the cheapest engine that fits the budget.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum capacity of the knapsack
+        epsilon: Request the FPTAS with this ε instead of an exact answer
+                 (raised if its table would go over the cell budget)
+        cell_budget: Largest DP table to build, exact or approximate
+        trace: Optional TraceRecorder receiving each step of the chosen engine,
+               re-sized for the table that engine builds; events refer to
+               the original items and capacity
+
+    Returns:
+        Dictionary in the same format as zero_one_knapsack, plus the name of
+        the engine used, the preprocessing summary (and the approximation
+        fields when approximated, with requested_epsilon if ε was raised)
+    """
+    # Shrink the instance before choosing a DP engine for it
+    reduced = preprocess_knapsack(weights, values, capacity)
+    r_weights, r_values, r_capacity = reduced['weights'], reduced['values'], reduced['capacity']
+    exact_cells = min(capacity_indexed_cells(r_weights, r_capacity),
+                      value_indexed_cells(r_weights, r_values, r_capacity))
+
+    if epsilon is not None or exact_cells > cell_budget:
+        # Approximate, with the smallest ε (at least the requested one) whose
+        # table fits the budget - or greedily when no ε up to MAX_EPSILON fits
+        requested_epsilon = epsilon
+        epsilon = fptas_epsilon_for_budget(r_weights, r_values, r_capacity, cell_budget,
+                                           epsilon if epsilon is not None else DEFAULT_EPSILON)
+        if epsilon is None:
+            engine, table_cells = 'greedy_knapsack', 0
+        else:
+            engine, table_cells = 'fptas_knapsack', fptas_cells(r_weights, r_values, r_capacity, epsilon)
+    else:
+        requested_epsilon = None
+        engine = exact_engine(r_weights, r_values, r_capacity)
+        if engine == 'min_weight_knapsack':
+            table_cells = value_indexed_cells(r_weights, r_values, r_capacity)
+        else:
+            table_cells = capacity_indexed_cells(r_weights, r_capacity)
+
+    if trace is not None:
+        # At most one event per table cell plus one per item
+        trace.expect(table_cells + len(r_weights) + 1)
+        trace = _OriginalItemTrace(trace, engine, reduced)
+
+    if engine == 'greedy_knapsack':
+        result = greedy_knapsack(r_weights, r_values, r_capacity, trace)
+    elif engine == 'fptas_knapsack':
+        result = fptas_knapsack(r_weights, r_values, r_capacity, epsilon, trace)
+    else:
+        result = exact_knapsack(r_weights, r_values, r_capacity, trace)
+    if requested_epsilon is not None and result['epsilon'] != requested_epsilon:
+        result['requested_epsilon'] = requested_epsilon
+
+    result = restore_solution(result, reduced)
+    result['engine'] = engine
+    return result
+
+
+class _OriginalItemTrace:
+    """
+    Recorder proxy mapping the events of an engine running on the reduced
+    instance back to the original items, and capacity columns back to the
+    original weight units where they are whole numbers.
+    """
+
+    def __init__(self, recorder, engine, reduced):
+        self.recorder = recorder
+        self.item_map = reduced['item_map']
+        self.column_factor = 1
+
+        if engine == 'zero_one_knapsack':
+            recorder.context = {'column': 'capacity'}
+            scale = weight_scale(reduced['weights'])
+            if scale == 1:
+                self.column_factor = reduced['stats']['weight_gcd']
+            else:
+                # Fractional weights were scaled up to integers by exact_knapsack
+                recorder.context['column_unit'] = 1 / scale
+        elif engine == 'min_weight_knapsack':
+            recorder.context = {'column': 'total value'}
+        elif engine == 'fptas_knapsack':
+            recorder.context = {'column': 'scaled total value'}
+
+    def record(self, kind, a, b=0):
+        if kind == DP_CELL or kind == BACKTRACK:
+            b *= self.column_factor
+        self.recorder.record(kind, self.item_map[a], b)
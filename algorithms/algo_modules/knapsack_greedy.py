@@ -9,8 +9,10 @@ Space Complexity: O(n) - for storing items
 """
 import time
 
+from .trace import SELECT
 
-def fractional_knapsack(weights, values, capacity):
+
+def fractional_knapsack(weights, values, capacity, trace=None):
     """
     Solve the Fractional Knapsack problem using a greedy approach.
     
@@ -18,6 +20,7 @@ def fractional_knapsack(weights, values, capacity):
         weights: List of item weights
         values: List of item values
         capacity: Maximum capacity of the knapsack
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
     
     Returns:
         Dictionary containing:
@@ -66,6 +69,9 @@ def fractional_knapsack(weights, values, capacity):
             value_added = item['value'] * fraction
             remaining_capacity = 0
         
+        if trace is not None:
+            trace.record(SELECT, item['index'], int(fraction == 1.0))
+        
         total_value += value_added
         selected_items.append({
             'item_index': item['index'] + 1,  # 1-indexed for display
@@ -87,3 +93,86 @@ def fractional_knapsack(weights, values, capacity):
         'algorithm_type': 'Greedy',
         'allows_fraction': True
     }
+
+
+def greedy_knapsack(weights, values, capacity, trace=None):
+    """
+    Approximate the 0/1 Knapsack problem within a factor of ½ greedily.
+    
+    Whole items are taken by value-to-weight ratio while they fit; the result
+    is the better of that set and the single most valuable item. Used when
+    even the FPTAS table would not fit the time budget.
+    
+    Time Complexity: O(n log n)
+    Space Complexity: O(n)
+    
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum capacity of the knapsack
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
+    
+    Returns:
+        Dictionary in the same format as fptas_knapsack, with ε = ½
+    """
+    start_time = time.perf_counter()
+    
+    n = len(weights)
+    
+    # Only items that fit on their own and add value can be part of a solution
+    candidates = [i for i in range(n) if weights[i] <= capacity and values[i] > 0]
+    candidates.sort(key=lambda i: values[i] / weights[i] if weights[i] > 0 else float('inf'), reverse=True)
+    
+    picked = []
+    remaining_capacity = capacity
+    for i in candidates:
+        if weights[i] <= remaining_capacity:
+            picked.append(i)
+            remaining_capacity -= weights[i]
+            if trace is not None:
+                trace.record(SELECT, i, 1)
+    
+    # The best single item covers the case where one large item was skipped
+    best_single = max(candidates, key=lambda i: values[i], default=None)
+    if best_single is not None and values[best_single] > sum(values[i] for i in picked):
+        picked = [best_single]
+        if trace is not None:
+            trace.record(SELECT, best_single, 0)
+    picked.sort()  # Original order
+    
+    selected_items = []
+    for i in picked:
+        selected_items.append({
+            'item_index': i + 1,  # 1-indexed for display
+            'weight': weights[i],
+            'value': values[i],
+            'fraction': 1.0,
+            'value_contributed': values[i]
+        })
+    max_value = sum(item['value'] for item in selected_items)
+    
+    end_time = time.perf_counter()
+    execution_time = (end_time - start_time) * 1000
+    
+    # OPT lies below both the fractional relaxation and 2 × max_value
+    upper_bound = fractional_knapsack(weights, values, capacity)['max_value']
+    best_bound = min(upper_bound, 2 * max_value)
+    optimality_gap = best_bound - max_value
+    
+    return {
+        'max_value': max_value,
+        'selected_items': selected_items,
+        'epsilon': 0.5,
+        'guarantee': '≥ ½ × OPT',
+        'guaranteed_ratio': 0.5,
+        'upper_bound': upper_bound,
+        'optimality_gap': round(optimality_gap, 2),
+        'optimality_gap_percent': round(optimality_gap / best_bound * 100, 2) if best_bound > 0 else 0.0,
+        'execution_time': round(execution_time, 4),
+        'time_complexity': 'O(n log n)',
+        'space_complexity': 'O(n)',
+        'algorithm_type': 'Greedy (½-approximation)',
+        'allows_fraction': False,
+        'approximation': 'Greedy ½-approximation',
+        'is_approximate': True
+    }
@@ -0,0 +1,152 @@
+"""
+0/1 Knapsack Preprocessing - Problem Reduction
+
+This module shrinks a 0/1 Knapsack instance before any solver runs on it and
+maps the solver's answer back to the original items. The reduced instance
+always has the same optimal value as the original one.
+
+Reductions applied, in order:
+- Drop items heavier than the capacity or without positive value
+- Drop dominated items: item j is dropped when lighter-and-more-valuable
+  items exist whose total weight plus w_j exceeds the capacity, so any
+  solution using j can swap it for one of them
+- Clamp the capacity to the total weight of the remaining items
+- Divide all weights and the capacity by the GCD of the weights
+
+Time Complexity: O(n log n) - sorting + Fenwick tree queries
+Space Complexity: O(n)
+"""
+import math
+import time
+
+
+def preprocess_knapsack(weights, values, capacity):
+    """
+    Reduce a 0/1 Knapsack instance without changing its optimal value.
+
+    Args:
+        weights: List of item weights
+        values: List of item values
+        capacity: Maximum capacity of the knapsack
+
+    Returns:
+        Dictionary containing:
+        - weights, values, capacity: The reduced instance
+        - item_map: Original 0-indexed position of each reduced item
+        - original_weights: Weights of the original instance
+        - stats: Summary of what each reduction removed
+    """
+    start_time = time.perf_counter()
+
+    n = len(weights)
+
+    oversized = [i for i in range(n) if weights[i] > capacity]
+    worthless = [i for i in range(n) if weights[i] <= capacity and values[i] <= 0]
+    candidates = [i for i in range(n) if weights[i] <= capacity and values[i] > 0]
+
+    kept = _drop_dominated(candidates, weights, values, capacity)
+    dominated_count = len(candidates) - len(kept)
+
+    reduced_weights = [weights[i] for i in kept]
+    reduced_values = [values[i] for i in kept]
+    reduced_capacity = min(capacity, sum(reduced_weights))
+
+    # Every feasible total weight is a multiple of the GCD, so the DP can
+    # work in units of it
+    divisor = 1
+    if reduced_weights and all(float(w).is_integer() for w in reduced_weights):
+        divisor = math.gcd(*(int(w) for w in reduced_weights))
+        if divisor > 1:
+            reduced_weights = [int(w) // divisor for w in reduced_weights]
+            reduced_capacity = int(reduced_capacity) // divisor
+
+    original_cells = n * (int(capacity) + 1)
+    reduced_cells = len(kept) * (int(reduced_capacity) + 1)
+
+    end_time = time.perf_counter()
+    execution_time = (end_time - start_time) * 1000
+
+    return {
+        'weights': reduced_weights,
+        'values': reduced_values,
+        'capacity': reduced_capacity,
+        'item_map': kept,
+        'original_weights': list(weights),
+        'stats': {
+            'original_items': n,
+            'remaining_items': len(kept),
+            'removed_oversized': len(oversized),
+            'removed_worthless': len(worthless),
+            'removed_dominated': dominated_count,
+            'weight_gcd': divisor,
+            'original_capacity': capacity,
+            'reduced_capacity': reduced_capacity,
+            'original_cells': original_cells,
+            'reduced_cells': reduced_cells,
+            'table_reduction': round(original_cells / reduced_cells, 2) if reduced_cells else None,
+            'execution_time': round(execution_time, 4)
+        }
+    }
+
+
+def restore_solution(result, reduced):
+    """
+    Map a solver result on the reduced instance back to the original items.
+
+    Item indices and weights in selected_items are rewritten to refer to the
+    original instance and the preprocessing summary is attached to the result.
+    """
+    restored = dict(result)
+    original_weights = reduced['original_weights']
+
+    selected_items = []
+    for item in result['selected_items']:
+        original_index = reduced['item_map'][item['item_index'] - 1]
+        selected_items.append(dict(
+            item,
+            item_index=original_index + 1,  # 1-indexed for display
+            weight=original_weights[original_index]
+        ))
+
+    restored['selected_items'] = selected_items
+    restored['preprocessing'] = reduced['stats']
+    restored['execution_time'] = round(result['execution_time'] + reduced['stats']['execution_time'], 4)
+    return restored
+
+
+def _drop_dominated(candidates, weights, values, capacity):
+    """
+    Return the candidates that survive dominance pruning, in original order.
+
+    Items are visited lightest first (most valuable first on ties), so every
+    item that dominates the current one has already been decided. A Fenwick
+    tree over value ranks gives the total weight of kept items worth at
+    least as much as the current item.
+    """
+    order = sorted(candidates, key=lambda i: (weights[i], -values[i], i))
+
+    # Rank values from most to least valuable (1-indexed for the tree)
+    distinct_values = sorted({values[i] for i in candidates}, reverse=True)
+    rank = {v: r + 1 for r, v in enumerate(distinct_values)}
+    tree = [0] * (len(distinct_values) + 1)
+
+    kept = []
+    for i in order:
+        # Total weight of kept items with value >= values[i]
+        dominator_weight = 0
+        r = rank[values[i]]
+        while r > 0:
+            dominator_weight += tree[r]
+            r -= r & -r
+
+        if dominator_weight + weights[i] > capacity:
+            continue
+
+        kept.append(i)
+        r = rank[values[i]]
+        while r < len(tree):
+            tree[r] += weights[i]
+            r += r & -r
+
+    kept.sort()
+    return kept
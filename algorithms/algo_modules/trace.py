@@ -0,0 +1,168 @@
+"""
+Step Trace Recorder - Compact Event Log for Algorithm Replay
+
+Algorithms accept an optional `trace` recorder and report each step to it
+(item considered, DP cell improved, predecessor found, slot claimed...).
+Events are kept in a fixed-size ring buffer of typed arrays rather than one
+dict per step: the step number and the main index are delta-encoded against
+the previous event so they fit in 2-byte slots, and an array is only widened
+when a value does not fit. Large runs can be sampled so only every Nth event
+is kept. With tracing off the algorithms only pay an `is not None` check.
+
+Item indices are 0-based positions in the caller's input everywhere.
+
+Space Complexity: O(capacity) - 7 bytes per slot (up to 25 once widened),
+with no more slots than the expected events need
+"""
+import math
+from array import array
+
+
+# Event kinds
+CONSIDER = 0      # Item / activity / job examined (index)
+SELECT = 1        # Chosen for the solution (index, detail)
+REJECT = 2        # Examined and skipped (index)
+DP_CELL = 3       # DP cell improved (index, column)
+PREDECESSOR = 4   # Latest compatible earlier job found (index, predecessor)
+SLOT_CLAIM = 5    # Time slot taken by a job (slot, index)
+BACKTRACK = 6     # Solution reconstruction step (index, column)
+
+# Field names of the two event operands, used when replaying
+EVENT_FIELDS = {
+    CONSIDER: ('consider', 'index', 'detail'),
+    SELECT: ('select', 'index', 'detail'),
+    REJECT: ('reject', 'index', 'detail'),
+    DP_CELL: ('dp_cell', 'index', 'column'),
+    PREDECESSOR: ('predecessor', 'index', 'predecessor'),
+    SLOT_CLAIM: ('slot_claim', 'slot', 'index'),
+    BACKTRACK: ('backtrack', 'index', 'column'),
+}
+
+DEFAULT_CAPACITY = 65536
+
+# Next wider typecode for an array whose values no longer fit
+_WIDER = {'H': 'I', 'I': 'Q', 'h': 'i', 'i': 'q'}
+
+
+class TraceRecorder:
+    """
+    Bounded recorder of algorithm steps.
+
+    Args:
+        capacity: Maximum number of events retained; older ones are dropped
+        sample_every: Keep only every Nth event (1 keeps all of them)
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, sample_every=1):
+        self._allocate(capacity, sample_every)
+
+    @classmethod
+    def for_expected_events(cls, expected_events, capacity=DEFAULT_CAPACITY):
+        """
+        Create a recorder sampled so that roughly expected_events fit in
+        capacity, with no more slots than the sampled events need.
+        """
+        return cls(*_sizing(expected_events, capacity))
+
+    def expect(self, expected_events, capacity=DEFAULT_CAPACITY):
+        """
+        Re-size an unused recorder as for_expected_events would, once the
+        caller knows better how many events are coming.
+        """
+        if self.seen:
+            raise ValueError("Cannot re-size a recorder that has recorded events")
+        self._allocate(*_sizing(expected_events, capacity))
+
+    def _allocate(self, capacity, sample_every):
+        if capacity < 1 or sample_every < 1:
+            raise ValueError("Capacity and sample rate must be positive")
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.seen = 0
+        self.count = 0
+        self._next = 0
+        self._kinds = array('B', bytes(capacity))
+        self._step_deltas = array('H', bytes(2 * capacity))
+        self._a_deltas = array('h', bytes(2 * capacity))
+        self._b_values = array('h', bytes(2 * capacity))
+        # What the event operands refer to, reported with the summary
+        self.context = {}
+        # Absolute step / operand of the event just before the oldest retained one
+        self._base_step = 0
+        self._base_a = 0
+        self._last_step = 0
+        self._last_a = 0
+
+    def record(self, kind, a, b=0):
+        """Record one step; a is delta-encoded, b is stored as is."""
+        self.seen += 1
+        if self.seen % self.sample_every:
+            return
+
+        i = self._next
+        if self.count == self.capacity:
+            # Drop the oldest event by folding its deltas into the base
+            self._base_step += self._step_deltas[i]
+            self._base_a += self._a_deltas[i]
+        else:
+            self.count += 1
+
+        self._kinds[i] = kind
+        try:
+            self._step_deltas[i] = self.seen - self._last_step
+            self._a_deltas[i] = a - self._last_a
+            self._b_values[i] = b
+        except OverflowError:
+            self._widen(i, self.seen - self._last_step, a - self._last_a, b)
+        self._last_step = self.seen
+        self._last_a = a
+        self._next = (i + 1) % self.capacity
+
+    def _widen(self, i, step_delta, a_delta, b):
+        """Store an event that overflowed, widening only the arrays that need it."""
+        for name, value in (('_step_deltas', step_delta), ('_a_deltas', a_delta), ('_b_values', b)):
+            values = getattr(self, name)
+            while True:
+                try:
+                    values[i] = value
+                    break
+                except OverflowError:
+                    values = array(_WIDER[values.typecode], values)
+            setattr(self, name, values)
+
+    @property
+    def dropped(self):
+        """Events sampled in but later overwritten by newer ones."""
+        return self.seen // self.sample_every - self.count
+
+    def summary(self):
+        return {
+            'events_seen': self.seen,
+            'events_retained': self.count,
+            'events_dropped': self.dropped,
+            'sample_every': self.sample_every,
+            'capacity': self.capacity,
+            **self.context,
+        }
+
+    def events(self):
+        """Yield retained events oldest first as (step, kind, a, b) tuples."""
+        start = (self._next - self.count) % self.capacity
+        step, a = self._base_step, self._base_a
+        for k in range(self.count):
+            i = (start + k) % self.capacity
+            step += self._step_deltas[i]
+            a += self._a_deltas[i]
+            yield step, self._kinds[i], a, self._b_values[i]
+
+    def replay(self):
+        """Yield retained events oldest first as readable dicts."""
+        for step, kind, a, b in self.events():
+            name, a_field, b_field = EVENT_FIELDS[kind]
+            yield {'step': step, 'event': name, a_field: a, b_field: b}
+
+
+def _sizing(expected_events, capacity):
+    """(buffer size, sample rate) keeping about expected_events within capacity."""
+    sample_every = max(1, math.ceil(expected_events / capacity))
+    return max(1, min(capacity, math.ceil(expected_events / sample_every))), sample_every
@@ -10,8 +10,10 @@ Space Complexity: O(n) - for DP table
 import time
 import bisect
 
+from .trace import PREDECESSOR, BACKTRACK
 
-def weighted_job_scheduling(job_ids, start_times, end_times, profits):
+
+def weighted_job_scheduling(job_ids, start_times, end_times, profits, trace=None):
     """
     Solve the Weighted Job Scheduling problem using Dynamic Programming.
     
@@ -20,6 +22,7 @@ def weighted_job_scheduling(job_ids, start_times, end_times, profits):
         start_times: List of job start times
         end_times: List of job end times
         profits: List of profits for each job
+        trace: Optional TraceRecorder receiving each step (None disables tracing)
     
     Returns:
         Dictionary containing:
@@ -86,6 +89,9 @@ def weighted_job_scheduling(job_ids, start_times, end_times, profits):
         last_non_conflict = find_last_non_conflicting(i)
         if last_non_conflict >= 0:
             include_profit += dp[last_non_conflict]
+        if trace is not None:
+            trace.record(PREDECESSOR, jobs[i]['original_index'],
+                         jobs[last_non_conflict]['original_index'] if last_non_conflict >= 0 else -1)
         
         # Option 2: Exclude current job (take previous best)
         exclude_profit = dp[i - 1]
@@ -106,10 +112,14 @@ def weighted_job_scheduling(job_ids, start_times, end_times, profits):
         if i == 0:
             # First job is always included if we reach here
             selected_indices.append(i)
+            if trace is not None:
+                trace.record(BACKTRACK, jobs[i]['original_index'], i)
             break
         elif include_profit > dp[i - 1]:
             # We included this job
             selected_indices.append(i)
+            if trace is not None:
+                trace.record(BACKTRACK, jobs[i]['original_index'], i)
             i = last_non_conflict
         else:
             # We excluded this job
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class AlgorithmsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'algorithms'
+
+    def ready(self):
+        from . import checks  # noqa: F401 - registers the system checks
+
+        # Solvers load on first use; import them at boot only when asked to
+        if getattr(settings, 'ALGOINSIGHT_WARMUP_SOLVERS', False):
+            from .solvers import warmup
+            warmup()
@@ -0,0 +1,34 @@
+"""
+System checks for deployment settings the app relies on.
+"""
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+# Cache backends that keep entries inside one worker process
+PER_PROCESS_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+@register()
+def check_result_cache(app_configs, **kwargs):
+    """Warn when scheduling results and traces would not be shared between workers."""
+    alias = getattr(settings, 'ALGOINSIGHT_RESULT_CACHE', 'default')
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    if backend is None:
+        return [Warning(
+            f"ALGOINSIGHT_RESULT_CACHE names the cache '{alias}', which is not configured.",
+            hint="Add it to CACHES.",
+            id='algorithms.W001',
+        )]
+    if backend in PER_PROCESS_CACHES:
+        return [Warning(
+            f"The result cache '{alias}' ({backend.rsplit('.', 1)[-1]}) is private to each worker process.",
+            hint="With more than one worker, 'Load more' and trace links can reach a worker without the "
+                 "result and return 404. Point ALGOINSIGHT_RESULT_CACHE at a shared, size-bounded cache "
+                 "such as FileBasedCache with MAX_ENTRIES, Redis or Memcached.",
+            id='algorithms.W002',
+        )]
+    return []
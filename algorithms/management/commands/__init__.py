@@ -0,0 +1 @@
+# management/commands/__init__.py
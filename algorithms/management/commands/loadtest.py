@@ -0,0 +1,527 @@
+"""
+Load-test the full request path of the app.
+
+Virtual users replay Post/Redirect/Get flows (POST the form, follow the
+redirect with a GET) for the knapsack and scheduling pages at a fixed
+concurrency. Requests run in-process through the project's WSGI application
+(or its ASGI application with --interface asgi) with cookies and CSRF
+checks handled as a browser would, or against a running server with --url.
+In-process runs are left out of the run history. The report covers
+throughput, latency percentiles, error rates and worker memory, and can be
+saved as JSON and compared with an earlier run.
+"""
+import asyncio
+import http.cookiejar
+import http.cookies
+import io
+import json
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+
+# Scenario profiles: flow mix (relative weights), instance sizes and concurrency
+PROFILES = {
+    'smoke': {
+        'users': 2,
+        'iterations': 5,
+        'mix': {'knapsack': 1, 'activity': 1, 'job': 1, 'weighted_job': 1},
+        'sizes': {'knapsack': 10, 'activity': 10, 'job': 10, 'weighted_job': 10},
+        'capacity': 100,
+    },
+    'mixed': {
+        'users': 8,
+        'iterations': 25,
+        'mix': {'knapsack': 4, 'activity': 2, 'job': 2, 'weighted_job': 2},
+        'sizes': {'knapsack': 50, 'activity': 200, 'job': 200, 'weighted_job': 200},
+        'capacity': 1000,
+    },
+    'knapsack_heavy': {
+        'users': 4,
+        'iterations': 10,
+        'mix': {'knapsack': 1},
+        'sizes': {'knapsack': 200},
+        'capacity': 20000,
+    },
+    'scheduling_large': {
+        'users': 4,
+        'iterations': 5,
+        'mix': {'activity': 1, 'job': 1, 'weighted_job': 1},
+        'sizes': {'activity': 5000, 'job': 5000, 'weighted_job': 5000},
+        'capacity': 0,
+    },
+}
+
+# Page and redirect target for each flow
+FLOW_PATHS = {
+    'knapsack': '/knapsack/',
+    'activity': '/scheduling/',
+    'job': '/scheduling/',
+    'weighted_job': '/scheduling/',
+}
+
+
+class Command(BaseCommand):
+    help = 'Replay knapsack and scheduling PRG flows at a set concurrency and report latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', default='smoke',
+                            help=f"Built-in profile ({', '.join(PROFILES)}) or path to a JSON profile")
+        parser.add_argument('--users', type=int, help='Override the number of concurrent users')
+        parser.add_argument('--iterations', type=int, help='Override the flows run per user')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated instances')
+        parser.add_argument('--url', help='Base URL of a running server (default: in-process)')
+        parser.add_argument('--interface', choices=('wsgi', 'asgi'), default='wsgi',
+                            help='Application driven in-process (default: wsgi)')
+        parser.add_argument('--asgi-application', default='algoinsight.asgi.application',
+                            help='Dotted path of the ASGI application for --interface asgi')
+        parser.add_argument('--host', default='localhost', help='Host header for in-process requests')
+        parser.add_argument('--record-history', action='store_true',
+                            help='Keep recording in-process flows in the run history (off by default)')
+        parser.add_argument('--pid', type=int, action='append', default=[],
+                            help='Worker process to report memory for (with --url, repeatable)')
+        parser.add_argument('--output', help='Write the report as JSON to this file')
+        parser.add_argument('--compare', help='Earlier JSON report to compare against')
+
+    def handle(self, *args, **options):
+        profile = _load_profile(options['profile'])
+        if options['users']:
+            profile['users'] = options['users']
+        if options['iterations']:
+            profile['iterations'] = options['iterations']
+
+        # Synthetic flows stay out of the SolverRun history unless asked for;
+        # a server driven with --url records them under its own settings
+        history = override_settings(ALGOINSIGHT_RUN_HISTORY=options['record_history'])
+        history.enable()
+        try:
+            self._run(profile, options)
+        finally:
+            history.disable()
+
+    def _run(self, profile, options):
+        samples = []
+        samples_lock = threading.Lock()
+
+        # Clients are set up (CSRF cookie included) before the clock starts
+        clients = []
+        for _ in range(profile['users']):
+            client = _make_client(options)
+            client.prepare()
+            clients.append(client)
+
+        def run_user(user_index):
+            rng = random.Random(options['seed'] * 1000 + user_index)
+            client = clients[user_index]
+            flows = list(profile['mix'])
+            weights = [profile['mix'][f] for f in flows]
+            for _ in range(profile['iterations']):
+                flow = rng.choices(flows, weights)[0]
+                sample = _run_flow(client, flow, _make_form(flow, profile, rng))
+                with samples_lock:
+                    samples.append(sample)
+
+        threads = [threading.Thread(target=run_user, args=(i,)) for i in range(profile['users'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = time.perf_counter() - start
+
+        report = _build_report(options['profile'], profile, samples, duration)
+        report['memory'] = _memory_report(options['url'], options['pid'])
+        self._print_report(report)
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                self._print_comparison(json.load(f), report)
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(f"Report written to {options['output']}")
+
+    def _print_report(self, report):
+        self.stdout.write(f"Profile {report['profile']} at commit {report['commit'] or 'unknown'}: "
+                          f"{report['users']} users, {report['flows']} flows in {report['duration_s']} s")
+        self.stdout.write(f"Throughput: {report['throughput_rps']} req/s, {report['throughput_fps']} flows/s")
+        self.stdout.write(f"{'Flow':<14}{'Count':>7}{'Errors':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'Max ms':>10}")
+        for name, stats in report['per_flow'].items():
+            self.stdout.write(f"{name:<14}{stats['count']:>7}{stats['errors']:>8}{stats['p50_ms']:>10}"
+                              f"{stats['p90_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}")
+        self.stdout.write(f"Error rate: {report['error_rate_percent']}%")
+        for worker, memory in report['memory'].items():
+            self.stdout.write(f"Memory ({worker}): {memory}")
+
+    def _print_comparison(self, old, new):
+        self.stdout.write(f"Compared with {old['profile']} at commit {old['commit'] or 'unknown'}:")
+        for key in ('throughput_rps', 'error_rate_percent'):
+            self.stdout.write(f"  {key}: {old[key]} → {new[key]}")
+        for name, stats in new['per_flow'].items():
+            if name in old['per_flow']:
+                before = old['per_flow'][name]
+                self.stdout.write(f"  {name} p50/p99 ms: {before['p50_ms']}/{before['p99_ms']} → "
+                                  f"{stats['p50_ms']}/{stats['p99_ms']}")
+
+
+class _InProcessClient:
+    """
+    Drive the project's application object directly, without a server.
+    Each user keeps its own cookies and sends the CSRF token like a browser,
+    so the full middleware stack runs as it does in production.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.cookies = {}
+        self.csrf_token = ''
+
+    def prepare(self):
+        """Fetch a form page once so every later POST can reuse its CSRF cookie."""
+        status, _ = self.get(FLOW_PATHS['knapsack'])
+        if status != 200:
+            raise CommandError(f"Could not fetch a CSRF token in-process (status {status})")
+        self.csrf_token = self.cookies.get(settings.CSRF_COOKIE_NAME, '')
+
+    def post(self, path, data):
+        body = urllib.parse.urlencode(dict(data, csrfmiddlewaretoken=self.csrf_token)).encode()
+        status, headers, _ = self._request('POST', path, body, {
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Referer': f'http://{self.host}{path}',
+        })
+        return status, headers.get('location')
+
+    def get(self, path):
+        status, _, body = self._request('GET', urllib.parse.urlsplit(path).path, b'', {})
+        return status, body
+
+    def _request(self, method, path, body, headers):
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in self.cookies.items())
+        status, response_headers, response_body = self._send(method, path, body, headers)
+
+        cookies = http.cookies.SimpleCookie()
+        for name, value in response_headers:
+            if name.lower() == 'set-cookie':
+                cookies.load(value)
+        for name, morsel in cookies.items():
+            if morsel['max-age'] == '0':
+                self.cookies.pop(name, None)
+            else:
+                self.cookies[name] = morsel.value
+        return status, {name.lower(): value for name, value in response_headers}, response_body
+
+    def _send(self, method, path, body, headers):
+        """Run one request; return (status, [(header, value)], body)."""
+        raise NotImplementedError
+
+
+class _WsgiClient(_InProcessClient):
+    """Call settings.WSGI_APPLICATION with a hand-built WSGI environ."""
+
+    def __init__(self, host):
+        super().__init__(host)
+        from django.core.servers.basehttp import get_internal_wsgi_application
+        self.application = get_internal_wsgi_application()
+
+    def _send(self, method, path, body, headers):
+        environ = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': path,
+            'QUERY_STRING': '',
+            'SERVER_NAME': self.host,
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'CONTENT_LENGTH': str(len(body)),
+            'HTTP_HOST': self.host,
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        for name, value in headers.items():
+            key = name.upper().replace('-', '_')
+            environ[key if key == 'CONTENT_TYPE' else f'HTTP_{key}'] = value
+
+        started = {}
+
+        def start_response(status, response_headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = response_headers
+
+        response = self.application(environ, start_response)
+        try:
+            response_body = b''.join(response)
+        finally:
+            # Fires request_finished, as a WSGI server would
+            if hasattr(response, 'close'):
+                response.close()
+        return started['status'], started['headers'], response_body
+
+
+class _AsgiClient(_InProcessClient):
+    """Call the project's ASGI application with a hand-built scope."""
+
+    def __init__(self, host, application_path):
+        super().__init__(host)
+        from django.utils.module_loading import import_string
+        self.application = import_string(application_path)
+        # One event loop per virtual user; a user never runs two requests at once
+        self.loop = asyncio.new_event_loop()
+
+    def _send(self, method, path, body, headers):
+        return self.loop.run_until_complete(self._call(method, path, body, headers))
+
+    async def _call(self, method, path, body, headers):
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': b'',
+            'root_path': '',
+            'headers': [(b'host', self.host.encode())] + [
+                (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers.items()
+            ],
+            'client': ('127.0.0.1', 0),
+            'server': (self.host, 80),
+        }
+        request_sent = False
+        response = {'headers': [], 'body': []}
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            # Django listens for a disconnect until the response is done; never send one
+            await asyncio.Event().wait()
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+                response['headers'] = [(name.decode('latin-1'), value.decode('latin-1'))
+                                       for name, value in message.get('headers', [])]
+            elif message['type'] == 'http.response.body':
+                response['body'].append(message.get('body', b''))
+
+        await self.application(scope, receive, send)
+        return response['status'], response['headers'], b''.join(response['body'])
+
+
+class _HttpClient:
+    """Drive a running server over HTTP with a per-user cookie jar."""
+
+    class _NoRedirect(urllib.request.HTTPRedirectHandler):
+        def redirect_request(self, *args, **kwargs):
+            return None
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(self.cookies), self._NoRedirect)
+        self.csrf_token = ''
+
+    def prepare(self):
+        """Fetch a form page once so every later POST can reuse its CSRF cookie."""
+        status, _ = self.get(FLOW_PATHS['knapsack'])
+        if status != 200:
+            raise CommandError(f"Could not fetch a CSRF token from {self.base_url} (status {status})")
+        self.csrf_token = next((c.value for c in self.cookies if c.name == settings.CSRF_COOKIE_NAME), '')
+
+    def post(self, path, data):
+        data = dict(data, csrfmiddlewaretoken=self.csrf_token)
+        request = urllib.request.Request(
+            self.base_url + path, urllib.parse.urlencode(data).encode(),
+            headers={'Referer': self.base_url + path})
+        try:
+            with self.opener.open(request) as response:
+                return response.status, response.headers.get('Location')
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('Location')
+
+    def get(self, path):
+        url = path if path.startswith('http') else self.base_url + path
+        try:
+            with self.opener.open(url) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, b''
+
+
+def _make_client(options):
+    if options['url']:
+        return _HttpClient(options['url'])
+    if options['interface'] == 'asgi':
+        return _AsgiClient(options['host'], options['asgi_application'])
+    return _WsgiClient(options['host'])
+
+
+def _run_flow(client, flow, form):
+    """Run one POST + redirected GET and time both halves."""
+    path = FLOW_PATHS[flow]
+    error = None
+
+    start = time.perf_counter()
+    try:
+        status, location = client.post(path, form)
+        post_ms = (time.perf_counter() - start) * 1000
+        if status != 302:
+            error = f'POST returned {status}'
+        else:
+            status, body = client.get(location or path)
+            if status != 200:
+                error = f'GET returned {status}'
+            elif b'alert-danger' in body:
+                error = 'Page rendered an error'
+    except Exception as e:
+        post_ms = (time.perf_counter() - start) * 1000
+        error = str(e)
+    total_ms = (time.perf_counter() - start) * 1000
+
+    return {'flow': flow, 'post_ms': post_ms, 'total_ms': total_ms, 'error': error}
+
+
+def _make_form(flow, profile, rng):
+    """Generate a random instance of the given size as form data."""
+    n = profile['sizes'][flow]
+    if flow == 'knapsack':
+        return {
+            'weights': ', '.join(str(rng.randint(1, 100)) for _ in range(n)),
+            'values': ', '.join(str(rng.randint(1, 100)) for _ in range(n)),
+            'capacity': str(profile['capacity']),
+        }
+
+    starts = [rng.randint(0, 10 * n) for _ in range(n)]
+    ends = [s + rng.randint(1, 20) for s in starts]
+    profits = [str(rng.randint(1, 100)) for _ in range(n)]
+    ids = [f'J{i + 1}' for i in range(n)]
+    if flow == 'activity':
+        return {
+            'problem_type': 'activity',
+            'start_times': ', '.join(map(str, starts)),
+            'finish_times': ', '.join(map(str, ends)),
+        }
+    if flow == 'job':
+        return {
+            'problem_type': 'job',
+            'job_ids': ', '.join(ids),
+            'deadlines': ', '.join(str(rng.randint(1, max(1, n // 2))) for _ in range(n)),
+            'profits': ', '.join(profits),
+        }
+    return {
+        'problem_type': 'weighted_job',
+        'wjob_ids': ', '.join(ids),
+        'wjob_start_times': ', '.join(map(str, starts)),
+        'wjob_end_times': ', '.join(map(str, ends)),
+        'wjob_profits': ', '.join(profits),
+    }
+
+
+def _load_profile(name):
+    if name in PROFILES:
+        return dict(PROFILES[name])
+    try:
+        with open(name) as f:
+            profile = json.load(f)
+    except OSError as e:
+        raise CommandError(f"Unknown profile {name!r}: {e}")
+    unknown = set(profile.get('mix', {})) - set(FLOW_PATHS)
+    if unknown:
+        raise CommandError(f"Unknown flows in profile: {', '.join(sorted(unknown))}")
+    return profile
+
+
+def _build_report(profile_name, profile, samples, duration):
+    per_flow = {}
+    for flow in sorted({s['flow'] for s in samples}):
+        flow_samples = [s for s in samples if s['flow'] == flow]
+        per_flow[flow] = _latency_stats(flow_samples)
+    per_flow['all'] = _latency_stats(samples)
+
+    errors = sum(1 for s in samples if s['error'])
+    return {
+        'profile': profile_name,
+        'settings': profile,
+        'commit': _git_commit(),
+        'users': profile['users'],
+        'flows': len(samples),
+        'duration_s': round(duration, 3),
+        'throughput_fps': round(len(samples) / duration, 2) if duration else 0,
+        # Each flow is two requests: the POST and the redirected GET
+        'throughput_rps': round(2 * len(samples) / duration, 2) if duration else 0,
+        'error_rate_percent': round(errors / len(samples) * 100, 2) if samples else 0,
+        'errors': sorted({s['error'] for s in samples if s['error']}),
+        'per_flow': per_flow,
+    }
+
+
+def _latency_stats(samples):
+    totals = sorted(s['total_ms'] for s in samples)
+    return {
+        'count': len(samples),
+        'errors': sum(1 for s in samples if s['error']),
+        'p50_ms': round(_percentile(totals, 50), 2),
+        'p90_ms': round(_percentile(totals, 90), 2),
+        'p99_ms': round(_percentile(totals, 99), 2),
+        'max_ms': round(totals[-1], 2) if totals else 0,
+        'mean_post_ms': round(statistics.fmean(s['post_ms'] for s in samples), 2) if samples else 0,
+    }
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _memory_report(url, pids):
+    """Peak and current RSS of the in-process worker, or of the given server workers."""
+    if not url:
+        # ru_maxrss is reported in kilobytes on Linux
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {'in-process': {'peak_rss_mb': round(peak_kb / 1024, 1)}}
+
+    report = {}
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                fields = dict(line.split(':', 1) for line in f if ':' in line)
+        except OSError:
+            report[f'pid {pid}'] = 'unavailable'
+            continue
+        report[f'pid {pid}'] = {
+            'peak_rss_mb': round(int(fields['VmHWM'].split()[0]) / 1024, 1),
+            'rss_mb': round(int(fields['VmRSS'].split()[0]) / 1024, 1),
+        }
+    return report
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=settings.BASE_DIR).stdout.strip() or None
+    except OSError:
+        return None
@@ -0,0 +1,239 @@
+"""
+Solve knapsack and scheduling instances in bulk, without going through HTTP.
+
+Instances are read as NDJSON (one JSON object per line) from a file or
+stdin, cut into chunks and solved by a process pool with the same registry
+solvers the views use. Results are written to stdout as NDJSON as chunks
+finish, or in input order with --ordered. Only a bounded number of chunks
+is held in memory at once. With --checkpoint, progress is saved after every
+chunk so an interrupted run can be resumed with the same command.
+
+Instance formats (an optional "id" is echoed back):
+    {"problem": "knapsack", "weights": [...], "values": [...], "capacity": 50, "epsilon": 0.1}
+    {"problem": "activity", "start_times": [...], "finish_times": [...]}
+    {"problem": "job", "job_ids": [...], "deadlines": [...], "profits": [...]}
+    {"problem": "weighted_job", "job_ids": [...], "start_times": [...], "end_times": [...], "profits": [...]}
+"""
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from algorithms.solvers import get_solver
+
+
+# Result keys only used to draw the web page; left out unless --full is given
+VISUALIZATION_KEYS = ('all_activities', 'all_jobs', 'time_markers', 'schedule')
+
+
+class Command(BaseCommand):
+    help = 'Solve NDJSON knapsack and scheduling instances with a process pool'
+
+    def add_arguments(self, parser):
+        parser.add_argument('input', nargs='?', default='-',
+                            help='NDJSON file of instances (default: stdin)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help='Worker processes (default: one per CPU)')
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Instances sent to a worker at a time')
+        parser.add_argument('--max-in-flight', type=int, default=None,
+                            help='Chunks held in memory at once (default: 2 × workers)')
+        parser.add_argument('--ordered', action='store_true',
+                            help='Write results in input order instead of as they finish')
+        parser.add_argument('--checkpoint',
+                            help='File recording finished chunks; resumes from it if present')
+        parser.add_argument('--full', action='store_true',
+                            help='Include visualization-only fields in the results')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        workers = options['workers'] or 1
+        max_in_flight = options['max_in_flight'] or 2 * workers
+        if chunk_size < 1 or max_in_flight < 1:
+            raise CommandError("Chunk size and in-flight limit must be positive")
+
+        checkpoint = _Checkpoint.load(options['checkpoint'], chunk_size)
+        source = sys.stdin if options['input'] == '-' else open(options['input'])
+        chunks = _read_chunks(source, chunk_size, checkpoint)
+
+        pending = {}        # future -> chunk index
+        finished = {}       # chunk index -> results, held back for --ordered
+        held = None         # chunk read but too far ahead of the oldest unfinished one
+        next_to_write = checkpoint.next_chunk
+        solved = 0
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                while True:
+                    # Keep the pool busy without reading more than the window allows
+                    while len(pending) + len(finished) < max_in_flight:
+                        chunk = held if held is not None else next(chunks, None)
+                        held = None
+                        if chunk is None:
+                            break
+                        index, lines = chunk
+                        # Never run further ahead of the oldest unfinished chunk than
+                        # the window, so the checkpoint's done_ahead stays within it
+                        if index >= checkpoint.next_chunk + max_in_flight:
+                            held = chunk
+                            break
+                        pending[pool.submit(_solve_chunk, lines, options['full'])] = index
+                    if not pending:
+                        break
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        results = future.result()
+                        if options['ordered']:
+                            finished[index] = results
+                            # Chunks finished by an earlier run are skipped over
+                            while next_to_write in finished or checkpoint.is_done(next_to_write):
+                                if next_to_write in finished:
+                                    solved += self._write(finished.pop(next_to_write))
+                                    checkpoint.mark_done(next_to_write)
+                                next_to_write += 1
+                        else:
+                            solved += self._write(results)
+                            checkpoint.mark_done(index)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
+        self.stderr.write(f"Solved {solved} instances")
+
+    def _write(self, results):
+        for record in results:
+            self.stdout.write(json.dumps(record))
+        self.stdout.flush()
+        return len(results)
+
+
+class _Checkpoint:
+    """
+    Finished chunks, stored as the first unfinished chunk plus the finished
+    chunks after it. handle() never submits a chunk more than the in-flight
+    window past the first unfinished one, so the file stays small.
+    Results are written before a chunk is marked done, so a resumed run may
+    repeat the last chunks but never skips any.
+    """
+
+    def __init__(self, path, chunk_size, next_chunk=0, done_ahead=()):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.next_chunk = next_chunk
+        self.done_ahead = set(done_ahead)
+
+    @classmethod
+    def load(cls, path, chunk_size):
+        if not path or not os.path.exists(path):
+            return cls(path, chunk_size)
+        with open(path) as f:
+            state = json.load(f)
+        if state['chunk_size'] != chunk_size:
+            raise CommandError(f"Checkpoint was written with --chunk-size {state['chunk_size']}")
+        return cls(path, chunk_size, state['next_chunk'], state['done_ahead'])
+
+    def is_done(self, index):
+        return index < self.next_chunk or index in self.done_ahead
+
+    def mark_done(self, index):
+        self.done_ahead.add(index)
+        while self.next_chunk in self.done_ahead:
+            self.done_ahead.remove(self.next_chunk)
+            self.next_chunk += 1
+        if self.path:
+            self._save()
+
+    def _save(self):
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'chunk_size': self.chunk_size,
+                'next_chunk': self.next_chunk,
+                'done_ahead': sorted(self.done_ahead),
+            }, f)
+        os.replace(tmp_path, self.path)
+
+
+def _read_chunks(source, chunk_size, checkpoint):
+    """Yield (chunk index, [(line number, text)]) lazily, skipping finished chunks."""
+    index = 0
+    line_number = 1
+    while True:
+        lines = list(islice(source, chunk_size))
+        if not lines:
+            return
+        if not checkpoint.is_done(index):
+            yield index, [(line_number + k, text) for k, text in enumerate(lines)]
+        index += 1
+        line_number += len(lines)
+
+
+def _solve_chunk(lines, full):
+    """Solve one chunk in a worker process; bad instances become error records."""
+    results = []
+    for line_number, text in lines:
+        if not text.strip():
+            continue
+        record = {'line': line_number}
+        try:
+            instance = json.loads(text)
+            record['id'] = instance.get('id')
+            record['problem'] = instance.get('problem')
+            record.update(_solve_instance(instance, full))
+        except Exception as e:
+            record['error'] = f'{type(e).__name__}: {e}'
+        results.append(record)
+    return results
+
+
+def _solve_instance(instance, full):
+    problem = instance.get('problem')
+
+    if problem == 'knapsack':
+        weights = [float(w) for w in instance['weights']]
+        values = [float(v) for v in instance['values']]
+        capacity = float(instance['capacity'])
+        if len(weights) != len(values):
+            raise ValueError("Number of weights must equal number of values")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        greedy_result = get_solver('fractional_knapsack')(weights, values, capacity)
+        dp_result = get_solver('governed_knapsack')(weights, values, capacity, instance.get('epsilon'))
+        return {
+            'greedy_result': greedy_result,
+            'dp_result': dp_result,
+            'value_difference': round(greedy_result['max_value'] - dp_result['max_value'], 2)
+        }
+
+    if problem == 'activity':
+        start_times = [int(s) for s in instance['start_times']]
+        finish_times = [int(f) for f in instance['finish_times']]
+        if len(start_times) != len(finish_times):
+            raise ValueError("Number of start times must equal number of finish times")
+        result = get_solver('activity_selection')(start_times, finish_times)
+    elif problem == 'job':
+        job_ids = [str(j) for j in instance['job_ids']]
+        deadlines = [int(d) for d in instance['deadlines']]
+        profits = [int(p) for p in instance['profits']]
+        if not (len(job_ids) == len(deadlines) == len(profits)):
+            raise ValueError("Number of job IDs, deadlines, and profits must match")
+        result = get_solver('job_scheduling')(job_ids, deadlines, profits)
+    elif problem == 'weighted_job':
+        job_ids = [str(j) for j in instance['job_ids']]
+        start_times = [int(s) for s in instance['start_times']]
+        end_times = [int(e) for e in instance['end_times']]
+        profits = [int(p) for p in instance['profits']]
+        if not (len(job_ids) == len(start_times) == len(end_times) == len(profits)):
+            raise ValueError("Number of job IDs, start times, end times, and profits must match")
+        result = get_solver('weighted_job_scheduling')(job_ids, start_times, end_times, profits)
+    else:
+        raise ValueError(f"Unknown problem: {problem!r}")
+
+    if not full:
+        result = {k: v for k, v in result.items() if k not in VISUALIZATION_KEYS}
+    return {'result': result}
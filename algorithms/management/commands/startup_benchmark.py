@@ -0,0 +1,76 @@
+"""
+Measure the idle import cost of the app in fresh interpreters.
+
+Each run starts a new Python process, sets Django up and imports the URL
+configuration (which pulls in the views), then reports how long that took
+and which solver modules were loaded along the way. With the lazy solver
+registry no solver module should be loaded at this point, so the cost stays
+flat as engines are added.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from algorithms.solvers import SOLVERS
+
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+setup_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+import algorithms.urls
+import_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({
+    'setup_ms': setup_ms,
+    'import_ms': import_ms,
+    'loaded': sorted(m for m in sys.modules if m.startswith('algorithms.algo_modules.')),
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the idle startup cost of the algorithms app'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=5,
+                            help='Number of fresh interpreters to measure')
+        parser.add_argument('--max-import-ms', type=float, default=None,
+                            help='Fail if the median URL/view import time exceeds this')
+
+    def handle(self, *args, **options):
+        env = dict(os.environ)
+        env.setdefault('DJANGO_SETTINGS_MODULE', settings.SETTINGS_MODULE)
+
+        samples = []
+        for _ in range(options['runs']):
+            completed = subprocess.run(
+                [sys.executable, '-c', PROBE],
+                capture_output=True, text=True, env=env, cwd=settings.BASE_DIR
+            )
+            if completed.returncode != 0:
+                raise CommandError(f"Startup probe failed:\n{completed.stderr}")
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+        setup_ms = statistics.median(s['setup_ms'] for s in samples)
+        import_ms = statistics.median(s['import_ms'] for s in samples)
+        loaded = samples[-1]['loaded']
+
+        self.stdout.write(f"Registered solvers:  {len(SOLVERS)}")
+        self.stdout.write(f"django.setup():      {setup_ms:.2f} ms (median of {len(samples)})")
+        self.stdout.write(f"URL/view import:     {import_ms:.2f} ms (median of {len(samples)})")
+        self.stdout.write(f"Solver modules idle: {', '.join(loaded) if loaded else 'none'}")
+
+        warmup = getattr(settings, 'ALGOINSIGHT_WARMUP_SOLVERS', False)
+        if loaded and not warmup:
+            raise CommandError("Solver modules were imported at startup; load them through algorithms.solvers")
+        if options['max_import_ms'] is not None and import_ms > options['max_import_ms']:
+            raise CommandError(f"Import took {import_ms:.2f} ms, over the {options['max_import_ms']} ms limit")
+        self.stdout.write(self.style.SUCCESS("Startup cost OK"))
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolverRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('problem', models.CharField(max_length=32)),
+                ('engine', models.CharField(max_length=32)),
+                ('n', models.PositiveIntegerField()),
+                ('capacity', models.BigIntegerField(blank=True, null=True)),
+                ('execution_time', models.FloatField()),
+                ('value', models.FloatField()),
+                ('greedy_gap', models.FloatField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['problem', 'engine', 'n', 'capacity'], name='solverrun_lookup_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SolverRunRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('problem', models.CharField(max_length=32)),
+                ('engine', models.CharField(max_length=32)),
+                ('size_bucket', models.PositiveSmallIntegerField()),
+                ('runs', models.PositiveIntegerField(default=0)),
+                ('total_time', models.FloatField(default=0)),
+                ('max_time', models.FloatField(default=0)),
+                ('compared_runs', models.PositiveIntegerField(default=0)),
+                ('greedy_matches', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['problem', 'engine', 'size_bucket'],
+                'constraints': [models.UniqueConstraint(fields=('problem', 'engine', 'size_bucket'), name='unique_rollup_bucket')],
+            },
+        ),
+    ]
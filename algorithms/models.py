@@ -0,0 +1,63 @@
+from django.db import models
+
+
+class SolverRun(models.Model):
+    """One solver invocation, written in batches by algorithms.run_history."""
+    problem = models.CharField(max_length=32)
+    engine = models.CharField(max_length=32)
+    n = models.PositiveIntegerField()
+    capacity = models.BigIntegerField(null=True, blank=True)  # W for knapsack, empty for scheduling
+    execution_time = models.FloatField()  # milliseconds
+    value = models.FloatField()
+    greedy_gap = models.FloatField(null=True, blank=True)  # greedy value - DP value, where both ran
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['problem', 'engine', 'n', 'capacity'], name='solverrun_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.engine} n={self.n} W={self.capacity} ({self.execution_time} ms)'
+
+
+class SolverRunRollup(models.Model):
+    """
+    Running totals of SolverRun rows per problem, engine and size bucket, kept
+    up to date by the history writer so summaries never scan SolverRun.
+
+    The size bucket is the bit length of n × W for knapsack and of n for
+    scheduling, i.e. sizes are grouped by power of two.
+    """
+    problem = models.CharField(max_length=32)
+    engine = models.CharField(max_length=32)
+    size_bucket = models.PositiveSmallIntegerField()
+    runs = models.PositiveIntegerField(default=0)
+    total_time = models.FloatField(default=0)
+    max_time = models.FloatField(default=0)
+    compared_runs = models.PositiveIntegerField(default=0)
+    greedy_matches = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['problem', 'engine', 'size_bucket'], name='unique_rollup_bucket'),
+        ]
+        ordering = ['problem', 'engine', 'size_bucket']
+
+    def __str__(self):
+        return f'{self.engine} bucket {self.size_bucket}: {self.runs} runs'
+
+    @property
+    def average_time(self):
+        return self.total_time / self.runs if self.runs else 0
+
+    @property
+    def greedy_match_rate(self):
+        return self.greedy_matches / self.compared_runs * 100 if self.compared_runs else None
+
+    @property
+    def size_range(self):
+        """Sizes covered by the bucket, as (low, high) inclusive."""
+        if self.size_bucket == 0:
+            return 0, 0
+        return 2 ** (self.size_bucket - 1), 2 ** self.size_bucket - 1
@@ -0,0 +1,155 @@
+"""
+Solver Run History
+
+Views call record_run() after each solver invocation. Records go onto a
+bounded in-memory queue and a background thread writes them to the database
+in batches, together with the matching SolverRunRollup totals, so requests
+never wait on the database. The thread is started on the first record.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .models import SolverRun, SolverRunRollup
+
+
+logger = logging.getLogger(__name__)
+
+
+BATCH_SIZE = 200            # Rows written per transaction at most
+FLUSH_INTERVAL = 2.0        # Seconds a record may wait for a batch to fill
+QUEUE_SIZE = 10_000         # Records buffered before new ones are dropped
+
+_queue = queue.Queue(maxsize=QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+_stop = object()
+_dropped_lock = threading.Lock()
+dropped = 0
+
+
+def record_run(problem, engine, n, execution_time, value, capacity=None, greedy_gap=None):
+    """
+    Queue one solver invocation for the history table without blocking.
+
+    Records are dropped (and counted in `dropped`) if the writer falls too far
+    behind, rather than slowing the request down, or if their batch cannot be
+    written (the error is logged).
+    """
+    if not getattr(settings, 'ALGOINSIGHT_RUN_HISTORY', True):
+        return
+    _ensure_writer()
+    try:
+        _queue.put_nowait({
+            'problem': problem,
+            'engine': engine,
+            'n': n,
+            'capacity': int(capacity) if capacity is not None else None,
+            'execution_time': execution_time,
+            'value': value,
+            'greedy_gap': greedy_gap,
+        })
+    except queue.Full:
+        _count_dropped(1)
+
+
+def size_bucket(n, capacity=None):
+    """Power-of-two bucket of the instance size (n × W, or n without a capacity)."""
+    size = n * (int(capacity) + 1) if capacity is not None else n
+    return size.bit_length()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_loop, name='run-history-writer', daemon=True)
+            _writer.start()
+            atexit.register(_shutdown)
+
+
+def _write_loop():
+    while True:
+        # Wait for the first record, then give the batch a moment to fill
+        batch = []
+        record = _queue.get()
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while record is not _stop:
+            batch.append(record)
+            if len(batch) >= BATCH_SIZE:
+                break
+            try:
+                record = _queue.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+
+        if batch:
+            _flush(batch)
+        if record is _stop:
+            return
+
+
+def _flush(batch):
+    """Write one batch; a failure is logged and its records counted as dropped."""
+    try:
+        _write_batch(batch)
+    except Exception:
+        # History is best effort; never let a bad batch kill the writer
+        logger.exception("Could not write %d solver runs to the history", len(batch))
+        _count_dropped(len(batch))
+    finally:
+        close_old_connections()
+
+
+def _count_dropped(count):
+    # Request threads and the writer thread both drop records
+    global dropped
+    with _dropped_lock:
+        dropped += count
+
+
+def _write_batch(batch):
+    """Insert the runs and fold them into the rollups in one transaction."""
+    totals = defaultdict(lambda: {'runs': 0, 'total_time': 0.0, 'max_time': 0.0,
+                                  'compared_runs': 0, 'greedy_matches': 0})
+    for record in batch:
+        key = (record['problem'], record['engine'], size_bucket(record['n'], record['capacity']))
+        bucket = totals[key]
+        bucket['runs'] += 1
+        bucket['total_time'] += record['execution_time']
+        bucket['max_time'] = max(bucket['max_time'], record['execution_time'])
+        if record['greedy_gap'] is not None:
+            bucket['compared_runs'] += 1
+            bucket['greedy_matches'] += abs(record['greedy_gap']) < 1e-9
+
+    with transaction.atomic():
+        SolverRun.objects.bulk_create([SolverRun(**record) for record in batch])
+        for (problem, engine, bucket_id), bucket in totals.items():
+            rollup, _ = SolverRunRollup.objects.get_or_create(
+                problem=problem, engine=engine, size_bucket=bucket_id)
+            SolverRunRollup.objects.filter(pk=rollup.pk).update(
+                runs=F('runs') + bucket['runs'],
+                total_time=F('total_time') + bucket['total_time'],
+                max_time=Greatest(F('max_time'), bucket['max_time']),
+                compared_runs=F('compared_runs') + bucket['compared_runs'],
+                greedy_matches=F('greedy_matches') + bucket['greedy_matches'],
+            )
+
+
+def _shutdown():
+    """Flush what is still queued when the process exits."""
+    try:
+        _queue.put(_stop, timeout=1)
+    except queue.Full:
+        return
+    _writer.join(timeout=5)
@@ -0,0 +1,131 @@
+"""
+Solver Registry
+
+Every problem/engine pair is declared here by name together with its
+capability metadata. The module implementing a solver is imported only the
+first time that solver is requested, so importing the views (and serving
+pages that run no algorithm) stays cheap however many engines are added.
+"""
+import importlib
+import threading
+
+
+SOLVERS = {
+    'fractional_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'greedy',
+        'module': 'algorithms.algo_modules.knapsack_greedy',
+        'function': 'fractional_knapsack',
+        'exact': True,
+        'allows_fraction': True,
+        'time_complexity': 'O(n log n)',
+    },
+    'zero_one_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'dp',
+        'module': 'algorithms.algo_modules.knapsack_dp',
+        'function': 'zero_one_knapsack',
+        'exact': True,
+        'allows_fraction': False,
+        'time_complexity': 'O(n × W)',
+    },
+    'min_weight_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'dp_value_indexed',
+        'module': 'algorithms.algo_modules.knapsack_dp',
+        'function': 'min_weight_knapsack',
+        'exact': True,
+        'allows_fraction': False,
+        'time_complexity': 'O(n × V)',
+    },
+    'fptas_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'fptas',
+        'module': 'algorithms.algo_modules.knapsack_fptas',
+        'function': 'fptas_knapsack',
+        'exact': False,
+        'allows_fraction': False,
+        'time_complexity': 'O(n³ / ε)',
+    },
+    'greedy_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'greedy_approximate',
+        'module': 'algorithms.algo_modules.knapsack_greedy',
+        'function': 'greedy_knapsack',
+        'exact': False,
+        'allows_fraction': False,
+        'time_complexity': 'O(n log n)',
+    },
+    'governed_knapsack': {
+        'problem': 'knapsack',
+        'engine': 'governed',
+        'module': 'algorithms.algo_modules.knapsack_governor',
+        'function': 'governed_knapsack',
+        'exact': False,
+        'allows_fraction': False,
+        'time_complexity': 'Bounded by cell budget',
+    },
+    'activity_selection': {
+        'problem': 'activity',
+        'engine': 'greedy',
+        'module': 'algorithms.algo_modules.activity_greedy',
+        'function': 'activity_selection',
+        'exact': True,
+        'time_complexity': 'O(n log n)',
+    },
+    'job_scheduling': {
+        'problem': 'job',
+        'engine': 'greedy',
+        'module': 'algorithms.algo_modules.job_greedy',
+        'function': 'job_scheduling',
+        'exact': True,
+        'time_complexity': 'O(n log n + n × d)',
+    },
+    'weighted_job_scheduling': {
+        'problem': 'weighted_job',
+        'engine': 'dp',
+        'module': 'algorithms.algo_modules.weighted_job_dp',
+        'function': 'weighted_job_scheduling',
+        'exact': True,
+        'time_complexity': 'O(n log n)',
+    },
+}
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_solver(name):
+    """
+    Return the solver function registered under name, importing its module
+    on first use.
+    """
+    solver = _loaded.get(name)
+    if solver is not None:
+        return solver
+
+    if name not in SOLVERS:
+        raise KeyError(f"Unknown solver: {name}")
+
+    with _lock:
+        if name not in _loaded:
+            spec = SOLVERS[name]
+            module = importlib.import_module(spec['module'])
+            _loaded[name] = getattr(module, spec['function'])
+    return _loaded[name]
+
+
+def solvers_for(problem):
+    """Names of all solvers registered for a problem, in declaration order."""
+    return [name for name, spec in SOLVERS.items() if spec['problem'] == problem]
+
+
+def loaded_solvers():
+    """Names of the solvers whose modules have been imported so far."""
+    return sorted(_loaded)
+
+
+def warmup(names=None):
+    """Import the given solvers (all of them by default) ahead of first use."""
+    for name in names if names is not None else SOLVERS:
+        get_solver(name)
@@ -8,6 +8,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initNavbarScroll();
     initFormValidation();
     initSmoothAnimations();
+    initLoadMore();
 });
 
 /**
@@ -89,6 +90,40 @@ function initSmoothAnimations() {
     });
 }
 
+/**
+ * Fetch further pages of large result tables on demand
+ */
+function initLoadMore() {
+    document.querySelectorAll('.load-more-btn').forEach(btn => {
+        btn.addEventListener('click', function() {
+            const target = document.querySelector(this.dataset.target);
+            const page = parseInt(this.dataset.page, 10);
+            
+            this.disabled = true;
+            fetch(`${this.dataset.url}?page=${page}`)
+                .then(response => {
+                    if (!response.ok) {
+                        throw new Error('Result expired');
+                    }
+                    return response.json();
+                })
+                .then(data => {
+                    target.insertAdjacentHTML('beforeend', data.html);
+                    this.querySelector('.shown-count').textContent = data.shown;
+                    this.dataset.page = page + 1;
+                    this.disabled = false;
+                    if (!data.has_next) {
+                        this.parentNode.remove();
+                    }
+                })
+                .catch(() => {
+                    this.disabled = false;
+                    showAlert('Could not load more rows. Please run the algorithm again.', 'danger');
+                });
+        });
+    });
+}
+
 /**
  * Show alert message
  */
@@ -0,0 +1,33 @@
+"""Brute-force reference solver and random instances shared by the knapsack tests."""
+import itertools
+
+
+def brute_force_knapsack(weights, values, capacity):
+    """Best total value over every subset of items."""
+    best = 0
+    for taken in itertools.product((0, 1), repeat=len(weights)):
+        weight = sum(w for w, t in zip(weights, taken) if t)
+        if weight <= capacity:
+            best = max(best, sum(v for v, t in zip(values, taken) if t))
+    return best
+
+
+def random_instance(rng):
+    """Small integer instance with repeated weights and values to hit ties."""
+    n = rng.randint(0, 9)
+    scale = rng.choice([1, 3, 10])
+    weights = [scale * rng.randint(1, 12) for _ in range(n)]
+    values = [rng.randint(-3, 30) for _ in range(n)]
+    capacity = rng.randint(1, 15 * scale * 3)
+    return weights, values, capacity
+
+
+def assert_valid_selection(test, result, weights, values, capacity):
+    """Check that result['selected_items'] is a feasible set worth max_value."""
+    selected = result['selected_items']
+    test.assertEqual(len({item['item_index'] for item in selected}), len(selected))
+    for item in selected:
+        test.assertEqual(item['weight'], weights[item['item_index'] - 1])
+        test.assertEqual(item['value'], values[item['item_index'] - 1])
+    test.assertLessEqual(sum(item['weight'] for item in selected), capacity)
+    test.assertEqual(sum(item['value'] for item in selected), result['max_value'])
@@ -0,0 +1,52 @@
+"""
+Brute-force regression tests for the exact 0/1 knapsack engines: the
+capacity-indexed DP, the value-indexed DP and the choice between them.
+"""
+import random
+import unittest
+
+from algorithms.algo_modules.knapsack_dp import (
+    zero_one_knapsack, min_weight_knapsack, exact_knapsack, exact_engine, capacity_indexed_cells, weight_scale
+)
+
+from .knapsack_cases import brute_force_knapsack, random_instance, assert_valid_selection
+
+
+class ExactKnapsackTests(unittest.TestCase):
+
+    def test_exact_engines_match_brute_force(self):
+        rng = random.Random(27)
+        for _ in range(300):
+            weights, values, capacity = random_instance(rng)
+            best = brute_force_knapsack(weights, values, capacity)
+            for solver in (zero_one_knapsack, min_weight_knapsack, exact_knapsack):
+                result = solver(weights, values, capacity)
+                self.assertEqual(result['max_value'], best, solver.__name__)
+                assert_valid_selection(self, result, weights, values, capacity)
+
+    def test_fractional_weights_match_brute_force(self):
+        rng = random.Random(127)
+        for _ in range(200):
+            n = rng.randint(1, 8)
+            weights = [rng.randint(1, 400) / rng.choice([1, 10, 100]) for _ in range(n)]
+            values = [rng.randint(1, 20) for _ in range(n)]
+            capacity = rng.uniform(1, sum(weights))
+            best = brute_force_knapsack(weights, values, capacity)
+            for solver in (min_weight_knapsack, exact_knapsack):
+                result = solver(weights, values, capacity)
+                self.assertEqual(result['max_value'], best, solver.__name__)
+                assert_valid_selection(self, result, weights, values, capacity)
+
+    def test_value_indexed_keeps_fractional_weights(self):
+        weights, values = [1000.5, 1000.6, 1000.7, 1000.8, 1000.9, 1001.0], [1, 2, 3, 4, 5, 6]
+        self.assertEqual(exact_engine(weights, values, 3001), 'min_weight_knapsack')
+        result = exact_knapsack(weights, values, 3001)
+        self.assertEqual(result['max_value'], 11)
+        assert_valid_selection(self, result, weights, values, 3001)
+
+    def test_weight_scale(self):
+        self.assertEqual(weight_scale([1, 2.0, 3]), 1)
+        self.assertEqual(weight_scale([0.1, 0.25]), 100)
+        self.assertIsNone(weight_scale([1 / 3]))
+        self.assertEqual(capacity_indexed_cells([1 / 3], 5), float('inf'))
+        self.assertEqual(exact_engine([1 / 3, 0.5], [1.5, 2.5], 1), 'zero_one_knapsack')
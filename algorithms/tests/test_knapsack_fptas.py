@@ -0,0 +1,70 @@
+"""
+Brute-force regression tests for the approximate knapsack engines: the
+FPTAS, its ε search within a cell budget and the greedy ½-approximation.
+"""
+import random
+import unittest
+
+from algorithms.algo_modules.knapsack_fptas import (
+    fptas_knapsack, fptas_cells, fptas_epsilon_for_budget, MAX_EPSILON
+)
+from algorithms.algo_modules.knapsack_greedy import greedy_knapsack
+
+from .knapsack_cases import brute_force_knapsack, random_instance, assert_valid_selection
+
+
+class FptasTests(unittest.TestCase):
+
+    def test_fptas_meets_guarantee(self):
+        rng = random.Random(26)
+        for _ in range(200):
+            weights, values, capacity = random_instance(rng)
+            best = brute_force_knapsack(weights, values, capacity)
+            for epsilon in (0.05, 0.5, 0.9):
+                result = fptas_knapsack(weights, values, capacity, epsilon)
+                self.assertGreaterEqual(result['max_value'], (1 - epsilon) * best - 1e-9)
+                assert_valid_selection(self, result, weights, values, capacity)
+
+    def test_fptas_handles_fractional_weights(self):
+        weights, values = [1000.5, 1000.6, 1000.7, 1000.8, 1000.9, 1001.0], [1, 2, 3, 4, 5, 6]
+        result = fptas_knapsack(weights, values, 3001, 0.1)
+        self.assertGreaterEqual(result['max_value'], 0.9 * brute_force_knapsack(weights, values, 3001))
+        assert_valid_selection(self, result, weights, values, 3001)
+
+    def test_epsilon_search_fits_budget(self):
+        rng = random.Random(126)
+        for _ in range(100):
+            n = rng.randint(1, 40)
+            weights = [rng.uniform(1, 100) for _ in range(n)]
+            values = [rng.uniform(1, 1000) for _ in range(n)]
+            capacity = sum(weights) / 2
+            budget = rng.choice([50, 500, 5000])
+            epsilon = fptas_epsilon_for_budget(weights, values, capacity, budget, 0.01)
+            if epsilon is None:
+                self.assertGreater(fptas_cells(weights, values, capacity, MAX_EPSILON), budget)
+            else:
+                self.assertLessEqual(epsilon, MAX_EPSILON)
+                self.assertLessEqual(fptas_cells(weights, values, capacity, epsilon), budget)
+                if epsilon > 0.01:
+                    # Smallest fitting ε on the 0.01 grid
+                    self.assertGreater(fptas_cells(weights, values, capacity, epsilon - 0.01), budget)
+
+    def test_requested_epsilon_kept_when_it_fits(self):
+        self.assertEqual(fptas_epsilon_for_budget([1, 2], [3, 4], 3, 1000, 0.05), 0.05)
+
+
+class GreedyKnapsackTests(unittest.TestCase):
+
+    def test_greedy_is_half_approximation(self):
+        rng = random.Random(226)
+        for _ in range(300):
+            weights, values, capacity = random_instance(rng)
+            best = brute_force_knapsack(weights, values, capacity)
+            result = greedy_knapsack(weights, values, capacity)
+            self.assertGreaterEqual(result['max_value'], best / 2)
+            assert_valid_selection(self, result, weights, values, capacity)
+
+    def test_best_single_item_beats_ratio_order(self):
+        # By ratio the small item goes first and the big one no longer fits
+        result = greedy_knapsack([1, 10], [2, 10], 10)
+        self.assertEqual([item['item_index'] for item in result['selected_items']], [2])
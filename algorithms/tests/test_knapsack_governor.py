@@ -0,0 +1,72 @@
+"""
+Regression tests for the governed knapsack engine choice and the lazy
+solver registry.
+"""
+import random
+import unittest
+
+from algorithms import solvers
+from algorithms.algo_modules.knapsack_fptas import MAX_EPSILON
+from algorithms.algo_modules.knapsack_governor import governed_knapsack
+
+from .knapsack_cases import brute_force_knapsack, random_instance, assert_valid_selection
+
+
+class GovernedKnapsackTests(unittest.TestCase):
+
+    def test_matches_brute_force_within_guarantee(self):
+        rng = random.Random(29)
+        for _ in range(200):
+            weights, values, capacity = random_instance(rng)
+            best = brute_force_knapsack(weights, values, capacity)
+            for cell_budget in (1, 50, 5_000_000):
+                result = governed_knapsack(weights, values, capacity, cell_budget=cell_budget)
+                self.assertGreaterEqual(result['max_value'], result.get('guaranteed_ratio', 1) * best - 1e-9)
+                assert_valid_selection(self, result, weights, values, capacity)
+                if cell_budget == 5_000_000:
+                    self.assertFalse(result.get('is_approximate', False))
+
+    def test_fractional_weights_stay_within_capacity(self):
+        rng = random.Random(129)
+        for _ in range(100):
+            n = rng.randint(1, 8)
+            weights = [rng.uniform(1, 50) for _ in range(n)]
+            values = [float(rng.randint(1, 30)) for _ in range(n)]
+            capacity = rng.uniform(1, sum(weights))
+            result = governed_knapsack(weights, values, capacity)
+            self.assertEqual(result['max_value'], brute_force_knapsack(weights, values, capacity))
+            assert_valid_selection(self, result, weights, values, capacity)
+
+    def test_large_instance_falls_back_to_greedy(self):
+        rng = random.Random(229)
+        weights = [rng.uniform(1, 1000) for _ in range(1000)]
+        values = [rng.uniform(1, 1000) for _ in range(1000)]
+        result = governed_knapsack(weights, values, sum(weights) / 3, cell_budget=100_000)
+        self.assertEqual(result['engine'], 'greedy_knapsack')
+        self.assertEqual(result['guaranteed_ratio'], 0.5)
+
+    def test_requested_epsilon_raised_to_fit_budget(self):
+        rng = random.Random(329)
+        weights = [rng.uniform(1, 100) for _ in range(40)]
+        values = [rng.uniform(1, 1000) for _ in range(40)]
+        result = governed_knapsack(weights, values, sum(weights) / 2, epsilon=0.01, cell_budget=200_000)
+        self.assertEqual(result['engine'], 'fptas_knapsack')
+        self.assertEqual(result['requested_epsilon'], 0.01)
+        self.assertTrue(0.01 < result['epsilon'] <= MAX_EPSILON)
+
+
+class SolverRegistryTests(unittest.TestCase):
+
+    def test_get_solver_returns_registered_function(self):
+        self.assertIs(solvers.get_solver('governed_knapsack'), governed_knapsack)
+        self.assertIn('governed_knapsack', solvers.loaded_solvers())
+
+    def test_unknown_solver(self):
+        with self.assertRaises(KeyError):
+            solvers.get_solver('no_such_solver')
+
+    def test_every_solver_loads(self):
+        solvers.warmup()
+        self.assertEqual(solvers.loaded_solvers(), sorted(solvers.SOLVERS))
+        for problem in ('knapsack', 'activity', 'job', 'weighted_job'):
+            self.assertTrue(solvers.solvers_for(problem))
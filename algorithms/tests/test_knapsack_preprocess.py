@@ -0,0 +1,50 @@
+"""
+Brute-force regression tests for the knapsack preprocessing reductions.
+
+These only exercise the algorithm modules, so they run with
+`python manage.py test algorithms` or with plain unittest / pytest.
+"""
+import random
+import unittest
+
+from algorithms.algo_modules.knapsack_dp import exact_knapsack
+from algorithms.algo_modules.knapsack_preprocess import preprocess_knapsack, restore_solution
+
+from .knapsack_cases import brute_force_knapsack, random_instance
+
+
+class KnapsackPreprocessTests(unittest.TestCase):
+
+    def test_reduction_keeps_optimal_value(self):
+        rng = random.Random(28)
+        for _ in range(300):
+            weights, values, capacity = random_instance(rng)
+            best = brute_force_knapsack(weights, values, capacity)
+            reduced = preprocess_knapsack(weights, values, capacity)
+            self.assertEqual(brute_force_knapsack(reduced['weights'], reduced['values'], reduced['capacity']), best)
+
+            restored = restore_solution(
+                exact_knapsack(reduced['weights'], reduced['values'], reduced['capacity']), reduced)
+            self.assertEqual(restored['max_value'], best)
+            selected = restored['selected_items']
+            self.assertLessEqual(sum(item['weight'] for item in selected), capacity)
+            self.assertEqual(sum(values[item['item_index'] - 1] for item in selected), best)
+
+    def test_dominated_items_are_dropped(self):
+        # Item 3 is heavier and worth less than items 1 and 2, and any set
+        # holding it has room to swap it for one of them
+        reduced = preprocess_knapsack([2, 2, 3], [5, 5, 4], 4)
+        self.assertEqual(reduced['item_map'], [0, 1])
+        self.assertEqual(reduced['stats']['removed_dominated'], 1)
+
+    def test_weights_divided_by_gcd(self):
+        reduced = preprocess_knapsack([6, 9, 12], [1, 2, 3], 20)
+        self.assertEqual(reduced['stats']['weight_gcd'], 3)
+        self.assertEqual((reduced['weights'], reduced['capacity']), ([2, 3, 4], 6))
+
+    def test_fractional_weights_are_not_scaled(self):
+        weights, values, capacity = [1.5, 2.5, 4.0, 3.5], [3, 4, 5, 1], 5.0
+        reduced = preprocess_knapsack(weights, values, capacity)
+        self.assertEqual(reduced['stats']['weight_gcd'], 1)
+        self.assertEqual(brute_force_knapsack(reduced['weights'], reduced['values'], reduced['capacity']),
+                         brute_force_knapsack(weights, values, capacity))
@@ -0,0 +1,86 @@
+"""
+Tests for the solver run history: batches written by the writer thread and
+folded into the per-bucket rollups.
+"""
+import threading
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from algorithms import run_history
+from algorithms.models import SolverRun, SolverRunRollup
+
+
+def run(engine='dp', n=10, capacity=100, execution_time=1.0, greedy_gap=None):
+    return {
+        'problem': 'knapsack', 'engine': engine, 'n': n, 'capacity': capacity,
+        'execution_time': execution_time, 'value': 42, 'greedy_gap': greedy_gap,
+    }
+
+
+class WriteBatchTests(TestCase):
+
+    def rollup(self, engine='dp', n=10, capacity=100):
+        return SolverRunRollup.objects.get(
+            problem='knapsack', engine=engine, size_bucket=run_history.size_bucket(n, capacity))
+
+    def test_batch_inserts_runs_and_rollup(self):
+        run_history._write_batch([
+            run(execution_time=1.5, greedy_gap=0),
+            run(execution_time=4.0, greedy_gap=-3),
+            run(execution_time=2.5),
+        ])
+        self.assertEqual(SolverRun.objects.count(), 3)
+        rollup = self.rollup()
+        self.assertEqual((rollup.runs, rollup.total_time, rollup.max_time), (3, 8.0, 4.0))
+        self.assertEqual((rollup.compared_runs, rollup.greedy_matches), (2, 1))
+
+    def test_batches_accumulate_into_existing_rollup(self):
+        run_history._write_batch([run(execution_time=5.0, greedy_gap=0)])
+        run_history._write_batch([run(execution_time=1.0, greedy_gap=0)])
+        rollup = self.rollup()
+        self.assertEqual((rollup.runs, rollup.total_time), (2, 6.0))
+        # A faster later batch must not lower the maximum
+        self.assertEqual(rollup.max_time, 5.0)
+        self.assertEqual(rollup.greedy_match_rate, 100)
+
+    def test_rollups_split_by_engine_and_bucket(self):
+        run_history._write_batch([
+            run(engine='dp'), run(engine='greedy'), run(engine='dp', n=1000, capacity=10_000),
+        ])
+        self.assertEqual(SolverRunRollup.objects.count(), 3)
+        self.assertEqual(self.rollup(engine='dp').runs, 1)
+        self.assertEqual(self.rollup(engine='dp', n=1000, capacity=10_000).runs, 1)
+
+    def test_failed_batch_is_logged_and_dropped(self):
+        before = run_history.dropped
+        with mock.patch.object(run_history, '_write_batch', side_effect=RuntimeError('db down')):
+            with self.assertLogs(run_history.logger, 'ERROR'):
+                run_history._flush([run(), run()])
+        self.assertEqual(run_history.dropped - before, 2)
+        self.assertFalse(SolverRun.objects.exists())
+
+
+class DroppedCounterTests(SimpleTestCase):
+
+    def test_concurrent_drops_all_counted(self):
+        before = run_history.dropped
+        threads = [threading.Thread(target=lambda: [run_history._count_dropped(1) for _ in range(5000)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(run_history.dropped - before, 40_000)
+
+
+class SizeBucketTests(SimpleTestCase):
+
+    def test_buckets_by_power_of_two(self):
+        self.assertEqual(run_history.size_bucket(0), 0)
+        self.assertEqual(run_history.size_bucket(1), 1)
+        self.assertEqual(run_history.size_bucket(7), 3)
+        self.assertEqual(run_history.size_bucket(8), 4)
+        # n × (W + 1) cells for knapsack
+        self.assertEqual(run_history.size_bucket(4, 3), 5)
+        self.assertEqual(run_history.size_bucket(4, 3.9), 5)
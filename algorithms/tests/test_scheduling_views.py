@@ -0,0 +1,91 @@
+"""
+Tests for the paginated scheduling results: the first page rendered into
+the page and the row endpoint serving the rest from the result cache.
+"""
+import json
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from algorithms import views
+
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'results': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-results'},
+}
+
+
+@override_settings(CACHES=TEST_CACHES, ALGOINSIGHT_RESULT_CACHE='results', ALGOINSIGHT_RUN_HISTORY=False)
+class SchedulingRowsViewTests(TestCase):
+
+    def solve_activities(self, count, spacing=1):
+        # Back-to-back activities, so every one of them is selected
+        response = self.client.post(reverse('algorithms:scheduling'), {
+            'problem_type': 'activity',
+            'start_times': ','.join(str(i * spacing) for i in range(count)),
+            'finish_times': ','.join(str((i + 1) * spacing) for i in range(count)),
+        }, follow=True)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def rows_url(self, result_id, table):
+        return reverse('algorithms:scheduling_rows', args=[result_id, table])
+
+    def test_first_page_only_in_page(self):
+        count = views.SCHEDULING_PAGE_SIZE * 2 + 10
+        response = self.solve_activities(count)
+        tables = response.context['result_tables']
+        self.assertEqual(tables['selected'], {
+            'total': count, 'shown': views.SCHEDULING_PAGE_SIZE, 'has_more': True
+        })
+        self.assertEqual(len(response.context['activity_result']['selected_activities']),
+                         views.SCHEDULING_PAGE_SIZE)
+
+    def test_rows_endpoint_pages_through_table(self):
+        count = views.SCHEDULING_PAGE_SIZE * 2 + 10
+        result_id = self.solve_activities(count).context['result_id']
+
+        page = self.client.get(self.rows_url(result_id, 'selected'), {'page': 2}).json()
+        self.assertEqual((page['page'], page['num_pages'], page['total']), (2, 3, count))
+        self.assertTrue(page['has_next'])
+        self.assertEqual(page['shown'], 2 * views.SCHEDULING_PAGE_SIZE)
+
+        last = self.client.get(self.rows_url(result_id, 'selected'), {'page': 3}).json()
+        self.assertFalse(last['has_next'])
+        self.assertEqual(last['shown'], count)
+
+    def test_rows_endpoint_streams_ndjson(self):
+        result_id = self.solve_activities(150).context['result_id']
+        response = self.client.get(self.rows_url(result_id, 'timeline'), {'format': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([row['activity_index'] for row in rows], list(range(1, 151)))
+
+    def test_unknown_result_or_table(self):
+        result_id = self.solve_activities(5).context['result_id']
+        self.assertEqual(self.client.get(self.rows_url('missing', 'selected')).status_code, 404)
+        self.assertEqual(self.client.get(self.rows_url(result_id, 'schedule')).status_code, 404)
+
+    def test_long_time_axis_is_thinned(self):
+        response = self.solve_activities(50, spacing=1000)
+        markers = response.context['activity_result']['time_markers']
+        self.assertLessEqual(len(markers), views.SCHEDULING_TIME_MARKERS + 1)
+        self.assertEqual((markers[0]['value'], markers[-1]['value']), (0, 50_000))
+        self.assertLess(response.content.count(b'time-marker'), 2 * views.SCHEDULING_TIME_MARKERS)
+
+
+class ThinTimeMarkersTests(SimpleTestCase):
+
+    def markers(self, count):
+        return [{'value': t, 'left_percent': t} for t in range(count)]
+
+    def test_short_axis_unchanged(self):
+        markers = self.markers(views.SCHEDULING_TIME_MARKERS)
+        self.assertEqual(views._thin_time_markers(markers), markers)
+
+    def test_long_axis_keeps_ends_and_even_spacing(self):
+        thinned = views._thin_time_markers(self.markers(50_001))
+        self.assertLessEqual(len(thinned), views.SCHEDULING_TIME_MARKERS + 1)
+        self.assertEqual((thinned[0]['value'], thinned[-1]['value']), (0, 50_000))
+        steps = {b['value'] - a['value'] for a, b in zip(thinned, thinned[1:-1])}
+        self.assertEqual(len(steps), 1)
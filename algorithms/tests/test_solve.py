@@ -0,0 +1,94 @@
+"""
+Tests for the solve management command: output order, error records and
+resuming from a checkpoint.
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+
+
+def activity(i):
+    return {'problem': 'activity', 'id': i, 'start_times': [0, i + 1], 'finish_times': [i + 1, i + 2]}
+
+
+class SolveCommandTests(SimpleTestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.checkpoint = os.path.join(self.dir.name, 'solve.checkpoint')
+
+    def write_input(self, instances):
+        path = os.path.join(self.dir.name, 'instances.ndjson')
+        with open(path, 'w') as f:
+            for instance in instances:
+                f.write((instance if isinstance(instance, str) else json.dumps(instance)) + '\n')
+        return path
+
+    def solve(self, path, **options):
+        stdout = StringIO()
+        options.setdefault('workers', 2)
+        call_command('solve', path, stdout=stdout, stderr=StringIO(), **options)
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_ordered_output_follows_input(self):
+        path = self.write_input([activity(i) for i in range(40)])
+        records = self.solve(path, chunk_size=3, max_in_flight=4, ordered=True)
+        self.assertEqual([r['id'] for r in records], list(range(40)))
+        self.assertEqual([r['line'] for r in records], list(range(1, 41)))
+        self.assertEqual(records[5]['result']['selected_count'], 2)
+        self.assertNotIn('all_activities', records[5]['result'])
+
+    def test_unordered_output_covers_every_instance(self):
+        path = self.write_input([activity(i) for i in range(40)])
+        records = self.solve(path, chunk_size=3)
+        self.assertEqual(sorted(r['id'] for r in records), list(range(40)))
+
+    def test_bad_instances_become_error_records(self):
+        path = self.write_input([
+            activity(0),
+            'not json',
+            {'problem': 'knapsack', 'id': 2, 'weights': [1, 2], 'values': [3], 'capacity': 5},
+            {'problem': 'sorting', 'id': 3},
+            {'problem': 'knapsack', 'id': 4, 'weights': [1, 2], 'values': [3, 4], 'capacity': 3},
+        ])
+        records = self.solve(path, chunk_size=2, ordered=True)
+        self.assertEqual([r['line'] for r in records], [1, 2, 3, 4, 5])
+        self.assertNotIn('error', records[0])
+        self.assertIn('JSONDecodeError', records[1]['error'])
+        self.assertIn('Number of weights', records[2]['error'])
+        self.assertIn('Unknown problem', records[3]['error'])
+        self.assertEqual(records[4]['dp_result']['max_value'], 7)
+
+    def test_resume_solves_only_unfinished_chunks(self):
+        path = self.write_input([activity(i) for i in range(20)])
+        with open(self.checkpoint, 'w') as f:
+            json.dump({'chunk_size': 2, 'next_chunk': 3, 'done_ahead': [5, 6]}, f)
+
+        records = self.solve(path, chunk_size=2, ordered=True, checkpoint=self.checkpoint)
+        # Chunks 3, 4, 7, 8 and 9 were still to do
+        self.assertEqual([r['id'] for r in records], [6, 7, 8, 9, 14, 15, 16, 17, 18, 19])
+        with open(self.checkpoint) as f:
+            self.assertEqual(json.load(f), {'chunk_size': 2, 'next_chunk': 10, 'done_ahead': []})
+
+        # A finished checkpoint leaves nothing to solve
+        self.assertEqual(self.solve(path, chunk_size=2, checkpoint=self.checkpoint), [])
+
+    def test_checkpoint_written_as_chunks_finish(self):
+        path = self.write_input([activity(i) for i in range(10)])
+        records = self.solve(path, chunk_size=4, checkpoint=self.checkpoint)
+        self.assertEqual(len(records), 10)
+        with open(self.checkpoint) as f:
+            self.assertEqual(json.load(f)['next_chunk'], 3)
+
+    def test_checkpoint_chunk_size_must_match(self):
+        path = self.write_input([activity(i) for i in range(4)])
+        with open(self.checkpoint, 'w') as f:
+            json.dump({'chunk_size': 2, 'next_chunk': 1, 'done_ahead': []}, f)
+        with self.assertRaisesMessage(CommandError, '--chunk-size 2'):
+            self.solve(path, chunk_size=3, checkpoint=self.checkpoint)
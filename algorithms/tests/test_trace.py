@@ -0,0 +1,105 @@
+"""
+Regression tests for the step-trace ring buffer and the knapsack events
+mapped back to the original instance.
+"""
+import random
+import unittest
+
+from algorithms.algo_modules.knapsack_dp import zero_one_knapsack
+from algorithms.algo_modules.knapsack_governor import governed_knapsack
+from algorithms.algo_modules.trace import TraceRecorder, CONSIDER, SELECT, DP_CELL, BACKTRACK
+
+
+class TraceRecorderTests(unittest.TestCase):
+
+    def record_random(self, recorder, count, seed, span=1000):
+        """Record count random events and return every (step, kind, a, b) sent."""
+        rng = random.Random(seed)
+        sent = []
+        for step in range(1, count + 1):
+            kind = rng.choice((CONSIDER, SELECT, DP_CELL))
+            a, b = rng.randint(-span, span), rng.randint(0, span)
+            recorder.record(kind, a, b)
+            sent.append((step, kind, a, b))
+        return sent
+
+    def test_ring_buffer_keeps_newest_events(self):
+        for count in (0, 5, 16, 17, 100):
+            recorder = TraceRecorder(capacity=16)
+            sent = self.record_random(recorder, count, count)
+            self.assertEqual(list(recorder.events()), sent[-16:])
+            self.assertEqual(recorder.dropped, max(0, count - 16))
+
+    def test_sampled_events_decode_after_wrapping(self):
+        recorder = TraceRecorder(capacity=7, sample_every=3)
+        sent = self.record_random(recorder, 100, 32)
+        self.assertEqual(list(recorder.events()), sent[2::3][-7:])
+
+    def test_arrays_widen_for_large_values(self):
+        recorder = TraceRecorder(capacity=16)
+        sent = self.record_random(recorder, 10, 1)
+        sent += [(step + 10, kind, a, b) for step, kind, a, b in self.record_random(recorder, 30, 2, span=10 ** 12)]
+        self.assertEqual(list(recorder.events()), sent[-16:])
+
+        # Sampling gaps above 65535 steps widen the step deltas
+        recorder = TraceRecorder(capacity=2, sample_every=70_000)
+        sent = self.record_random(recorder, 300_000, 3)
+        self.assertEqual(list(recorder.events()), sent[69_999::70_000][-2:])
+
+    def test_small_values_use_narrow_arrays(self):
+        recorder = TraceRecorder(capacity=100)
+        self.record_random(recorder, 50, 4)
+        self.assertEqual((recorder._step_deltas.itemsize, recorder._a_deltas.itemsize), (2, 2))
+
+    def test_buffer_sized_to_expected_events(self):
+        self.assertEqual(TraceRecorder.for_expected_events(3).capacity, 3)
+        recorder = TraceRecorder.for_expected_events(10, capacity=4)
+        self.assertEqual((recorder.capacity, recorder.sample_every), (4, 3))
+
+        recorder.expect(2)
+        self.assertEqual((recorder.capacity, recorder.sample_every), (2, 1))
+        recorder.record(CONSIDER, 1)
+        with self.assertRaises(ValueError):
+            recorder.expect(10)
+
+
+class KnapsackTraceTests(unittest.TestCase):
+
+    def test_dp_events_use_zero_based_items(self):
+        recorder = TraceRecorder()
+        result = zero_one_knapsack([2, 3], [3, 4], 5, trace=recorder)
+        events = list(recorder.replay())
+        self.assertEqual({e['index'] for e in events if e['event'] == 'dp_cell'}, {0, 1})
+        backtracked = sorted(e['index'] for e in events if e['event'] == 'backtrack')
+        self.assertEqual(backtracked, [item['item_index'] - 1 for item in result['selected_items']])
+
+    def test_governed_events_refer_to_original_items(self):
+        # Item 1 is dominated and dropped; weights share a GCD of 10
+        weights, values = [40, 20, 30, 50], [1, 5, 6, 9]
+        recorder = TraceRecorder()
+        result = governed_knapsack(weights, values, 60, trace=recorder)
+        self.assertEqual(result['engine'], 'zero_one_knapsack')
+        self.assertEqual(result['preprocessing']['weight_gcd'], 10)
+
+        events = list(recorder.replay())
+        self.assertEqual(recorder.summary()['column'], 'capacity')
+        self.assertNotIn(0, {e['index'] for e in events})
+        backtracked = [e for e in events if e['event'] == 'backtrack']
+        self.assertEqual(sorted(e['index'] for e in backtracked),
+                         [item['item_index'] - 1 for item in result['selected_items']])
+        # Capacity columns are back in the caller's units
+        self.assertEqual(max(e['column'] for e in backtracked), 60)
+        for e in events:
+            if e['event'] == 'dp_cell':
+                self.assertEqual(e['column'] % 10, 0)
+                self.assertGreaterEqual(e['column'], weights[e['index']])
+
+    def test_governed_events_for_value_indexed_engine(self):
+        weights, values = [10 ** 8 + 1, 2 * 10 ** 8 + 1, 3 * 10 ** 8 + 1], [1, 2, 3]
+        recorder = TraceRecorder()
+        result = governed_knapsack(weights, values, 4 * 10 ** 8, trace=recorder)
+        self.assertEqual(result['engine'], 'min_weight_knapsack')
+        self.assertEqual(recorder.summary()['column'], 'total value')
+        self.assertGreater(recorder.count, 0)
+        self.assertEqual(recorder.dropped, 0)
+        self.assertLessEqual(max(e['index'] for e in recorder.replay()), 2)
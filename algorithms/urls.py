@@ -7,4 +7,7 @@ urlpatterns = [
     path('', views.home_view, name='home'),
     path('knapsack/', views.knapsack_view, name='knapsack'),
     path('scheduling/', views.scheduling_view, name='scheduling'),
+    path('scheduling/results/<str:result_id>/<str:table>/', views.scheduling_rows_view, name='scheduling_rows'),
+    path('trace/<str:trace_id>/', views.trace_replay_view, name='trace_replay'),
+    path('history/', views.history_view, name='history'),
 ]
@@ -1,10 +1,49 @@
+import itertools
+import json
+import math
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.http import Http404, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect
+from django.template.loader import render_to_string
 from django.urls import reverse
-from .algo_modules.knapsack_greedy import fractional_knapsack
-from .algo_modules.knapsack_dp import zero_one_knapsack
-from .algo_modules.activity_greedy import activity_selection
-from .algo_modules.job_greedy import job_scheduling
-from .algo_modules.weighted_job_dp import weighted_job_scheduling
+from .algo_modules.trace import TraceRecorder
+from .models import SolverRunRollup
+from .run_history import record_run
+from .solvers import get_solver
+
+
+# Rows of each scheduling table rendered into the page; the rest are fetched on demand
+SCHEDULING_PAGE_SIZE = 100
+
+# How long a scheduling result stays available to the row endpoints (seconds)
+SCHEDULING_RESULT_TIMEOUT = 60 * 60
+
+# How long a recorded step trace stays available for replay (seconds)
+TRACE_TIMEOUT = 60 * 60
+
+# Most time-axis ticks drawn under a timeline; longer axes are thinned out
+SCHEDULING_TIME_MARKERS = 25
+
+# Paginated tables per scheduling problem: table name -> (result key, row template)
+SCHEDULING_TABLES = {
+    'activity': {
+        'selected': ('selected_activities', 'partials/activity_selected_rows.html'),
+        'timeline': ('all_activities', 'partials/activity_timeline_rows.html'),
+    },
+    'job': {
+        'selected': ('selected_jobs', 'partials/job_selected_rows.html'),
+        'schedule': ('schedule', 'partials/job_schedule_slots.html'),
+    },
+    'weighted_job': {
+        'input': ('all_jobs', 'partials/weighted_job_input_rows.html'),
+        'selected': ('selected_jobs', 'partials/weighted_job_selected_rows.html'),
+        'timeline': ('all_jobs', 'partials/weighted_job_timeline_rows.html'),
+    },
+}
 
 
 def home_view(request):
@@ -16,6 +55,8 @@ def knapsack_view(request):
     """
     Handle Knapsack problem - both input form and result display.
     Compares Fractional (Greedy) vs 0/1 (DP) Knapsack.
+    The 0/1 side is solved by the governed engine, which falls back to the
+    FPTAS approximation when an epsilon is given or the exact DP is over budget.
     Uses session to store results and PRG pattern to avoid form resubmission.
     """
     context = {
@@ -29,6 +70,7 @@ def knapsack_view(request):
             weights_str = request.POST.get('weights', '')
             values_str = request.POST.get('values', '')
             capacity = request.POST.get('capacity', '')
+            epsilon_str = request.POST.get('epsilon', '').strip()
             
             # Convert to lists
             weights = [float(w.strip()) for w in weights_str.split(',') if w.strip()]
@@ -42,10 +84,21 @@ def knapsack_view(request):
                 raise ValueError("Please enter at least one item")
             if capacity <= 0:
                 raise ValueError("Capacity must be positive")
+            epsilon = float(epsilon_str) if epsilon_str else None
+            if epsilon is not None and not 0 < epsilon < 1:
+                raise ValueError("Epsilon must be between 0 and 1")
             
             # Run algorithms
-            greedy_result = fractional_knapsack(weights, values, capacity)
-            dp_result = zero_one_knapsack(weights, values, capacity)
+            greedy_trace = _new_trace(request, len(weights))
+            # governed_knapsack re-sizes this for the table it actually builds
+            dp_trace = _new_trace(request, len(weights))
+            greedy_result = get_solver('fractional_knapsack')(weights, values, capacity, trace=greedy_trace)
+            dp_result = get_solver('governed_knapsack')(weights, values, capacity, epsilon, trace=dp_trace)
+            record_run('knapsack', 'fractional_knapsack', len(weights), greedy_result['execution_time'],
+                       greedy_result['max_value'], capacity=capacity)
+            record_run('knapsack', dp_result['engine'], len(weights), dp_result['execution_time'],
+                       dp_result['max_value'], capacity=capacity,
+                       greedy_gap=greedy_result['max_value'] - dp_result['max_value'])
             
             # Store results in session
             request.session['knapsack_results'] = {
@@ -58,6 +111,10 @@ def knapsack_view(request):
                 },
                 'greedy_result': greedy_result,
                 'dp_result': dp_result,
+                'trace_ids': {
+                    'greedy': _store_trace(greedy_trace),
+                    'dp': _store_trace(dp_trace)
+                },
                 'comparison': {
                     'greedy_value': greedy_result['max_value'],
                     'dp_value': dp_result['max_value'],
@@ -87,6 +144,8 @@ def scheduling_view(request):
     """
     Handle Scheduling problems - Activity Selection, Job Scheduling, and Weighted Job Scheduling.
     Uses session to store results and PRG pattern to avoid form resubmission.
+    Only the first page of each large table goes into the session; the full
+    result is cached and served by scheduling_rows_view.
     """
     context = {
         'show_activity_results': False,
@@ -113,17 +172,24 @@ def scheduling_view(request):
                     raise ValueError("Please enter at least one activity")
                 
                 # Run algorithm
-                result = activity_selection(start_times, finish_times)
+                trace = _new_trace(request, len(start_times))
+                result = get_solver('activity_selection')(start_times, finish_times, trace=trace)
+                record_run('activity', 'activity_selection', len(start_times), result['execution_time'],
+                           result['selected_count'])
+                result_id, first_page, tables = _store_scheduling_result('activity', result)
                 
                 # Store results in session
                 request.session['scheduling_results'] = {
                     'show_activity_results': True,
                     'activity_input': {
-                        'start_times': start_times,
-                        'finish_times': finish_times,
+                        'start_times': start_times[:SCHEDULING_PAGE_SIZE],
+                        'finish_times': finish_times[:SCHEDULING_PAGE_SIZE],
                         'num_activities': len(start_times)
                     },
-                    'activity_result': result
+                    'activity_result': first_page,
+                    'result_id': result_id,
+                    'result_tables': tables,
+                    'trace_id': _store_trace(trace)
                 }
                 
                 # Redirect to avoid form resubmission
@@ -145,18 +211,25 @@ def scheduling_view(request):
                     raise ValueError("Please enter at least one job")
                 
                 # Run algorithm
-                result = job_scheduling(job_ids, deadlines, profits)
+                trace = _new_trace(request, 2 * len(job_ids))
+                result = get_solver('job_scheduling')(job_ids, deadlines, profits, trace=trace)
+                record_run('job', 'job_scheduling', len(job_ids), result['execution_time'],
+                           result['total_profit'])
+                result_id, first_page, tables = _store_scheduling_result('job', result)
                 
                 # Store results in session
                 request.session['scheduling_results'] = {
                     'show_job_results': True,
                     'job_input': {
-                        'job_ids': job_ids,
-                        'deadlines': deadlines,
-                        'profits': profits,
+                        'job_ids': job_ids[:SCHEDULING_PAGE_SIZE],
+                        'deadlines': deadlines[:SCHEDULING_PAGE_SIZE],
+                        'profits': profits[:SCHEDULING_PAGE_SIZE],
                         'num_jobs': len(job_ids)
                     },
-                    'job_result': result
+                    'job_result': first_page,
+                    'result_id': result_id,
+                    'result_tables': tables,
+                    'trace_id': _store_trace(trace)
                 }
                 
                 # Redirect to avoid form resubmission
@@ -180,19 +253,26 @@ def scheduling_view(request):
                     raise ValueError("Please enter at least one job")
                 
                 # Run algorithm
-                result = weighted_job_scheduling(job_ids, start_times, end_times, profits)
+                trace = _new_trace(request, 2 * len(job_ids))
+                result = get_solver('weighted_job_scheduling')(job_ids, start_times, end_times, profits, trace=trace)
+                record_run('weighted_job', 'weighted_job_scheduling', len(job_ids), result['execution_time'],
+                           result['max_profit'])
+                result_id, first_page, tables = _store_scheduling_result('weighted_job', result)
                 
                 # Store results in session
                 request.session['scheduling_results'] = {
                     'show_weighted_job_results': True,
                     'weighted_job_input': {
-                        'job_ids': job_ids,
-                        'start_times': start_times,
-                        'end_times': end_times,
-                        'profits': profits,
+                        'job_ids': job_ids[:SCHEDULING_PAGE_SIZE],
+                        'start_times': start_times[:SCHEDULING_PAGE_SIZE],
+                        'end_times': end_times[:SCHEDULING_PAGE_SIZE],
+                        'profits': profits[:SCHEDULING_PAGE_SIZE],
                         'num_jobs': len(job_ids)
                     },
-                    'weighted_job_result': result
+                    'weighted_job_result': first_page,
+                    'result_id': result_id,
+                    'result_tables': tables,
+                    'trace_id': _store_trace(trace)
                 }
                 
                 # Redirect to avoid form resubmission
@@ -209,3 +289,154 @@ def scheduling_view(request):
         context.update(results)
     
     return render(request, 'scheduling.html', context)
+
+
+def history_view(request):
+    """
+    Summarise recorded solver runs per engine and instance size.
+    Reads only the pre-aggregated rollups, never the raw run table.
+    """
+    rollups = SolverRunRollup.objects.all()
+    problem = request.GET.get('problem', '')
+    if problem:
+        rollups = rollups.filter(problem=problem)
+    
+    rows = []
+    for rollup in rollups:
+        low, high = rollup.size_range
+        rows.append({
+            'problem': rollup.problem,
+            'engine': rollup.engine,
+            'size_low': low,
+            'size_high': high,
+            'runs': rollup.runs,
+            'average_time': round(rollup.average_time, 4),
+            'max_time': round(rollup.max_time, 4),
+            'greedy_match_rate': round(rollup.greedy_match_rate, 1) if rollup.compared_runs else None
+        })
+    
+    return render(request, 'history.html', {
+        'rows': rows,
+        'problem': problem,
+        'problems': ['knapsack', 'activity', 'job', 'weighted_job']
+    })
+
+
+def scheduling_rows_view(request, result_id, table):
+    """
+    Serve one page of a stored scheduling result table as rendered rows.
+    With ?format=ndjson the whole table is streamed instead, one JSON row per line.
+    """
+    stored = _result_cache().get(_scheduling_cache_key(result_id))
+    if stored is None:
+        raise Http404("Result not found or expired")
+    tables = SCHEDULING_TABLES[stored['problem']]
+    if table not in tables:
+        raise Http404("Unknown table")
+    
+    result_key, row_template = tables[table]
+    rows = stored['result'][result_key]
+    
+    if request.GET.get('format') == 'ndjson':
+        return StreamingHttpResponse(
+            (json.dumps(row) + '\n' for row in rows),
+            content_type='application/x-ndjson'
+        )
+    
+    paginator = Paginator(rows, SCHEDULING_PAGE_SIZE)
+    page = paginator.get_page(request.GET.get('page'))
+    return JsonResponse({
+        'html': render_to_string(row_template, {'rows': page.object_list}, request),
+        'page': page.number,
+        'num_pages': paginator.num_pages,
+        'has_next': page.has_next(),
+        'shown': page.end_index(),
+        'total': paginator.count
+    })
+
+
+def trace_replay_view(request, trace_id):
+    """
+    Stream a recorded step trace as NDJSON: a summary line, then one event per line.
+    """
+    recorder = _result_cache().get(_trace_cache_key(trace_id))
+    if recorder is None:
+        raise Http404("Trace not found or expired")
+    
+    lines = itertools.chain([recorder.summary()], recorder.replay())
+    return StreamingHttpResponse(
+        (json.dumps(line) + '\n' for line in lines),
+        content_type='application/x-ndjson'
+    )
+
+
+def _store_scheduling_result(problem, result):
+    """
+    Cache the full result for the row endpoints and return its id, a copy of
+    the result holding only the first page of each paginated table, and the
+    row counts of those tables.
+    """
+    if 'time_markers' in result:
+        result = dict(result, time_markers=_thin_time_markers(result['time_markers']))
+    
+    result_id = uuid.uuid4().hex
+    _result_cache().set(_scheduling_cache_key(result_id), {'problem': problem, 'result': result},
+                       SCHEDULING_RESULT_TIMEOUT)
+    
+    first_page = dict(result)
+    tables = {}
+    for table, (result_key, _) in SCHEDULING_TABLES[problem].items():
+        rows = result[result_key]
+        first_page[result_key] = rows[:SCHEDULING_PAGE_SIZE]
+        tables[table] = {
+            'total': len(rows),
+            'shown': len(first_page[result_key]),
+            'has_more': len(rows) > SCHEDULING_PAGE_SIZE
+        }
+    return result_id, first_page, tables
+
+
+def _thin_time_markers(markers):
+    """
+    Keep at most SCHEDULING_TIME_MARKERS evenly spaced ticks (plus the last one);
+    the algorithms emit one per time unit, which is unbounded in the input.
+    """
+    if len(markers) <= SCHEDULING_TIME_MARKERS:
+        return markers
+    step = math.ceil((len(markers) - 1) / (SCHEDULING_TIME_MARKERS - 1))
+    thinned = markers[::step]
+    if thinned[-1] is not markers[-1]:
+        thinned.append(markers[-1])
+    return thinned
+
+
+def _result_cache():
+    """
+    Cache holding scheduling results and traces between requests. It must be
+    shared by every worker process (see ALGOINSIGHT_RESULT_CACHE).
+    """
+    return caches[getattr(settings, 'ALGOINSIGHT_RESULT_CACHE', 'default')]
+
+
+def _scheduling_cache_key(result_id):
+    return f'scheduling_result:{result_id}'
+
+
+def _new_trace(request, expected_events):
+    """Return a step recorder if the form asked for a trace, else None."""
+    if request.POST.get('trace') != 'on':
+        return None
+    return TraceRecorder.for_expected_events(expected_events)
+
+
+def _store_trace(recorder):
+    """Cache a recorded trace for trace_replay_view and return its id."""
+    if recorder is None:
+        return None
+    trace_id = uuid.uuid4().hex
+    _result_cache().set(_trace_cache_key(trace_id), recorder, TRACE_TIMEOUT)
+    return trace_id
+
+
+def _trace_cache_key(trace_id):
+    return f'trace:{trace_id}'